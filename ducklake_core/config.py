@@ -14,6 +14,12 @@ def load_sources_config(cfg_path: Path) -> Dict:
 # Core pipeline sources
 SOURCES = ['page_count', 'search_logs']
 
+# User agent enrichment columns, shared by the pandas enricher and the SQL pipeline
+USER_AGENT_COLUMNS = [
+    'agent_type', 'os', 'os_version', 'browser', 'browser_version',
+    'device', 'is_mobile', 'is_tablet', 'is_pc', 'is_bot'
+]
+
 
 class TimestampField(Enum):
     """Common timestamp field names in different formats."""
@@ -4,29 +4,40 @@ import time
 from contextlib import contextmanager
 from typing import Dict
 
+NS_PER_S = 1_000_000_000
+
+
+def _ns_to_s(ns: int) -> float:
+    return round(ns / NS_PER_S, 3)
+
 
 class PipelineTimer:
-    """Track execution times for different pipeline phases."""
+    """Track execution times for different pipeline phases.
+
+    start_time is the wall-clock creation time (epoch seconds); durations are
+    measured with integer perf_counter_ns readings, which are monotonic.
+    """
 
     def __init__(self):
         self.start_time = time.time()
+        self.start_ns = time.perf_counter_ns()
         self.phases: Dict[str, float] = {}
 
     @contextmanager
     def phase(self, name: str):
         """Context manager for timing a specific phase."""
-        phase_start = time.time()
+        phase_start = time.perf_counter_ns()
         try:
             yield
         finally:
-            self.phases[f"{name}_s"] = round(time.time() - phase_start, 3)
+            self.phases[f"{name}_s"] = _ns_to_s(time.perf_counter_ns() - phase_start)
 
     def get_total_time(self) -> float:
         """Get total elapsed time since timer creation."""
-        return round(time.time() - self.start_time, 3)
+        return _ns_to_s(time.perf_counter_ns() - self.start_ns)
 
     def get_summary(self) -> Dict[str, float]:
         """Get timing summary including total time."""
         summary = self.phases.copy()
         summary['total_s'] = self.get_total_time()
-        return summary
\ No newline at end of file
+        return summary
@@ -1,17 +1,68 @@
 """Search log parsing utilities with format-specific handlers."""
 from __future__ import annotations
+import csv
+import functools
 import json
+import mmap
+import multiprocessing
 import re
 import pathlib
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, List, Dict, Any, Iterator, Union
 from urllib.parse import urlparse, parse_qs, unquote
+import duckdb
 from .config import LogFormat, QueryField, UrlField, IpField, TimestampField
+from .sql_loader import get_sql_path, load_sql_file
+
+try:
+    import orjson
+    _json_loads = orjson.loads  # accepts str or bytes
+except ImportError:
+    _json_loads = json.loads
+
+# Date-only or space-separated date time; other shapes pass through unchanged
+_NORMALIZABLE_TS_RE = re.compile(r'^(20\d{2}-\d{2}-\d{2})(?: (\d{2}:\d{2}:\d{2}))?$')
+_DATE_ONLY_RE = re.compile(r'^(20\d{2}-\d{2}-\d{2})$')
+_TIMESTAMP_RE = re.compile(r'(20\d{2}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:Z|[+-]\d{2}:?\d{2})?)')
+_DATE_RE = re.compile(r'20\d{2}-\d{2}-\d{2}')
+_DATE_BYTES_RE = re.compile(rb'20\d{2}-\d{2}-\d{2}')
+_URL_RE = re.compile(r'(https?://\S+)')
+
+# Format detection reads the first 8 KiB of a file (enough for 1000 characters of
+# multi-byte UTF-8) and inspects only the first FORMAT_SAMPLE_CHARS decoded characters
+FORMAT_SAMPLE_BYTES = 8192
+FORMAT_SAMPLE_CHARS = 1000
+
+# Even with workers requested, files smaller than this are parsed in-process;
+# each spawned worker pays ~0.15 s importing this module (and duckdb) before parsing
+PARALLEL_MIN_BYTES = 64 << 20
+
+# Workers are spawned, never forked: callers usually hold a DuckDB connection whose
+# worker threads would leave locks held in a forked child
+_POOL_CONTEXT = multiprocessing.get_context('spawn')
 
 
 def detect_log_format(file_path: pathlib.Path) -> LogFormat:
     """Detect the format of a log file by examining its content."""
     try:
-        sample = file_path.read_text(encoding='utf-8', errors='ignore')[:1000]
+        st = file_path.stat()
+    except OSError:
+        return LogFormat.PLAIN_TEXT
+    return _detect_cached(str(file_path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=1024)
+def _detect_cached(path_str: str, mtime_ns: int, size: int) -> LogFormat:
+    """Memoized detection; a changed mtime or size yields a new cache key."""
+    return _detect_impl(pathlib.Path(path_str))
+
+
+def _detect_impl(file_path: pathlib.Path) -> LogFormat:
+    try:
+        with file_path.open('rb') as f:
+            head = f.read(FORMAT_SAMPLE_BYTES).decode('utf-8', errors='ignore')
+        sample = head.replace('\r\n', '\n').replace('\r', '\n')[:FORMAT_SAMPLE_CHARS]
         sample = sample.strip()
 
         if sample.startswith('INFO:root:') and ' - IP:' in sample and ' - Query:' in sample:
@@ -32,20 +83,21 @@ def normalize_timestamp(raw: Optional[str], assume_utc: bool = True) -> Optional
         return None
 
     raw = raw.strip()
+    if not raw:
+        return None
 
-    # Space-separated date time -> T format
-    if re.match(r'^20\d{2}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$', raw):
-        return raw.replace(' ', 'T') + ('Z' if assume_utc else '')
-
-    # Date only -> append midday
-    if re.match(r'^20\d{2}-\d{2}-\d{2}$', raw):
-        return raw + 'T12:00:00' + ('Z' if assume_utc else '')
+    # One match classifies the shape: date only gets midday, space becomes 'T'
+    match = _NORMALIZABLE_TS_RE.match(raw)
+    if match is None:
+        return raw
 
-    return raw
+    date_part, time_part = match.groups()
+    return f"{date_part}T{time_part or '12:00:00'}{'Z' if assume_utc else ''}"
 
 
+@functools.lru_cache(maxsize=4096)
 def extract_query_from_url(url_str: str) -> Optional[str]:
-    """Extract query parameter from URL string."""
+    """Extract query parameter from URL string (memoized; URLs repeat heavily)."""
     try:
         if not url_str:
             return None
@@ -88,10 +140,10 @@ def parse_structured_log_line(line: str, assume_utc: bool = True) -> Optional[Di
     return None
 
 
-def parse_json_line(line: str, assume_utc: bool = True) -> Optional[Dict[str, Any]]:
-    """Parse JSON line format."""
+def parse_json_line(line: Union[str, bytes], assume_utc: bool = True) -> Optional[Dict[str, Any]]:
+    """Parse JSON line format (str, or undecoded bytes straight from the file)."""
     try:
-        obj = json.loads(line)
+        obj = _json_loads(line)
         if not isinstance(obj, dict):
             return None
 
@@ -137,16 +189,26 @@ def parse_json_line(line: str, assume_utc: bool = True) -> Optional[Dict[str, An
 
 def parse_csv_line(line: str, assume_utc: bool = True) -> Optional[Dict[str, Any]]:
     """Parse CSV-like line format."""
-    parts = [p.strip() for p in line.split(',')]
+    return _parse_csv_fields(line.split(','), assume_utc)
+
+
+def _has_date_separators(field: str) -> bool:
+    """Cheap shape check for YYYY-MM-DD[ T]HH:MM:SS prefixes (dashes at 4 and 7)."""
+    return len(field) >= 10 and field[4] == '-' and field[7] == '-' and (
+        len(field) == 10 or (field[10] in 'T ' and field[13:14] == ':' and field[16:17] == ':')
+    )
+
+
+def _parse_csv_fields(fields: List[str], assume_utc: bool) -> Optional[Dict[str, Any]]:
+    """Build a record from the fields of one CSV row."""
+    parts = [p.strip() for p in fields]
     if not parts:
         return None
 
     first = parts[0]
-    timestamp_regex = re.compile(r'(20\d{2}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:Z|[+-]\d{2}:?\d{2})?)')
-    date_regex = re.compile(r'^(20\d{2}-\d{2}-\d{2})$')
 
-    # Check if first field is a timestamp
-    if timestamp_regex.match(first) or date_regex.match(first):
+    # Check if first field is a timestamp; separator positions reject most rows before any regex
+    if _has_date_separators(first) and (_TIMESTAMP_RE.match(first) or _DATE_ONLY_RE.match(first)):
         timestamp = normalize_timestamp(first, assume_utc)
 
         # Look for query in remaining fields
@@ -169,18 +231,31 @@ def parse_csv_line(line: str, assume_utc: bool = True) -> Optional[Dict[str, Any
     return None
 
 
+def parse_csv_file(file_path: pathlib.Path, assume_utc: bool = True) -> List[Dict[str, Any]]:
+    """Parse a whole CSV file with csv.reader (handles quoted fields and embedded commas)."""
+    return _parse_csv_file(file_path, assume_utc, columnar=False)
+
+
+def _parse_csv_file(file_path: pathlib.Path, assume_utc: bool, columnar: bool):
+    collector = _Collector(columnar)
+    with file_path.open('r', encoding='utf-8', errors='ignore', newline='') as f:
+        for fields in csv.reader(f):
+            record = _parse_csv_fields(fields, assume_utc)
+            if record:
+                collector.add(record)
+    return collector.result()
+
+
 def parse_plain_text_line(line: str, assume_utc: bool = True) -> Optional[Dict[str, Any]]:
     """Parse plain text line using regex patterns."""
-    timestamp_regex = re.compile(r'(20\d{2}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:Z|[+-]\d{2}:?\d{2})?)')
-
     # Extract timestamp
-    ts_match = timestamp_regex.search(line)
+    ts_match = _TIMESTAMP_RE.search(line)
     timestamp = normalize_timestamp(ts_match.group(1), assume_utc) if ts_match else None
 
     query = None
 
     # Try to extract from URL
-    url_match = re.search(r'(https?://\S+)', line)
+    url_match = _URL_RE.search(line)
     if url_match:
         query = extract_query_from_url(url_match.group(1))
 
@@ -197,59 +272,225 @@ def parse_plain_text_line(line: str, assume_utc: bool = True) -> Optional[Dict[s
     return None
 
 
-def parse_search_logs_file(file_path: pathlib.Path, assume_utc: bool = True) -> List[Dict[str, Any]]:
-    """Parse search logs file with automatic format detection."""
+def iter_file_lines(file_path: pathlib.Path) -> Iterator[bytes]:
+    """Yield raw (undecoded) lines of a file by scanning an mmap for newlines."""
+    with open(file_path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return
+        with mm:
+            size = len(mm)
+            start = 0
+            while start < size:
+                end = mm.find(b'\n', start)
+                if end < 0:
+                    end = size
+                yield mm[start:end]
+                start = end + 1
+
+
+def parse_structured_log_file(file_path: pathlib.Path, assume_utc: bool = True) -> List[Dict[str, Any]]:
+    """Parse a structured log file in DuckDB with a single vectorized regex pass."""
+    return _parse_structured_log_file(file_path, assume_utc, columnar=False)
+
+
+# DuckDB's file readers expand these in paths; such files use the Python line parser
+_GLOB_CHARS = frozenset('*?[')
+
+_structured_conn: Optional[duckdb.DuckDBPyConnection] = None
+
+
+def _parse_structured_log_file(file_path: pathlib.Path, assume_utc: bool, columnar: bool):
+    global _structured_conn
+    if _GLOB_CHARS.intersection(str(file_path)):
+        return _parse_lines(iter_file_lines(file_path), LogFormat.STRUCTURED_LOG, assume_utc, columnar)
+    sql = load_sql_file(get_sql_path('parsers/search_logs_structured.sql'))
+    if _structured_conn is None:
+        _structured_conn = duckdb.connect()
+    # One in-memory database is reused; each call gets its own cursor
+    with _structured_conn.cursor() as cur:
+        rows = cur.execute(sql, [str(file_path)]).fetchall()
+
+    collector = _Collector(columnar)
+    for ts, ip, query in rows:
+        timestamp = normalize_timestamp(ts.strip(), assume_utc)
+        query = query.strip()
+        if timestamp and query:
+            collector.add({'timestamp': timestamp, 'query': query, 'ip': ip.strip()})
+    return collector.result()
+
+
+def parse_search_logs_file(file_path: pathlib.Path, assume_utc: bool = True,
+                           workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Parse search logs file with automatic format detection.
+
+    Parsing is sequential unless workers > 1 is passed; then line-based files of
+    PARALLEL_MIN_BYTES or more are split across that many spawned processes, which
+    requires the calling script's entry point to sit under `if __name__ == '__main__':`.
+    If the pool can't start or dies, the file is parsed sequentially instead.
+    """
+    return _parse_search_logs(file_path, assume_utc, columnar=False, workers=workers)
+
+
+def _parse_search_logs(file_path: pathlib.Path, assume_utc: bool, columnar: bool,
+                       workers: Optional[int] = None):
+    """Shared dispatch: returns a list of records, or SEARCH_LOG_COLUMNS lists if columnar."""
     if not file_path.exists():
         raise FileNotFoundError(f"Log file not found: {file_path}")
 
     format_type = detect_log_format(file_path)
-    records = []
 
+    if format_type == LogFormat.STRUCTURED_LOG:
+        try:
+            return _parse_structured_log_file(file_path, assume_utc, columnar)
+        except duckdb.Error:
+            pass  # e.g. invalid UTF-8; fall back to the line-by-line parser below
+
+    try:
+        if format_type == LogFormat.CSV:
+            # Quoted fields may span lines, so CSV files are not split into byte ranges
+            return _parse_csv_file(file_path, assume_utc, columnar)
+
+        size = file_path.stat().st_size
+        if workers and workers > 1 and size >= PARALLEL_MIN_BYTES:
+            try:
+                return _parse_file_parallel(file_path, size, workers, format_type, assume_utc, columnar)
+            except BrokenProcessPool:
+                pass  # e.g. no importable __main__ (stdin script); parse in-process below
+        return _parse_lines(iter_file_lines(file_path), format_type, assume_utc, columnar)
+    except OSError as e:
+        raise RuntimeError(f"Failed to read log file {file_path}: {e}")
+
+
+SEARCH_LOG_COLUMNS = ['timestamp', 'ip', 'query']
+
+
+class _Collector:
+    """Accumulates parsed records as a list of dicts, or straight into SEARCH_LOG_COLUMNS lists."""
+
+    __slots__ = ('records', 'columns')
+
+    def __init__(self, columnar: bool):
+        self.records: Optional[List[Dict[str, Any]]] = None if columnar else []
+        self.columns: Optional[Dict[str, List[Optional[str]]]] = (
+            {name: [] for name in SEARCH_LOG_COLUMNS} if columnar else None
+        )
+
+    def add(self, record: Dict[str, Any]) -> None:
+        if self.records is not None:
+            self.records.append(record)
+        else:
+            for name, column in self.columns.items():
+                column.append(record.get(name))
+
+    def result(self):
+        return self.records if self.records is not None else self.columns
+
+
+def _parse_lines(lines, format_type: LogFormat, assume_utc: bool, columnar: bool = False):
+    """Parse raw byte lines with the line parser for the given format."""
+    collector = _Collector(columnar)
     total_lines = 0
     parsed_lines = 0
     skipped_no_timestamp = 0
     skipped_no_query = 0
 
-    try:
-        content = file_path.read_text(errors='ignore')
-    except Exception as e:
-        raise RuntimeError(f"Failed to read log file {file_path}: {e}")
-
-    for raw_line in content.splitlines():
+    for raw_line in lines:
         total_lines += 1
-        line = raw_line.strip()
+        line_bytes = raw_line.strip()
 
-        if not line:
+        if not line_bytes:
             continue
 
         record = None
 
-        # Parse based on detected format
-        if format_type == LogFormat.STRUCTURED_LOG:
-            record = parse_structured_log_line(line, assume_utc)
-        elif format_type == LogFormat.JSON_LINES:
-            record = parse_json_line(line, assume_utc)
-        elif format_type == LogFormat.CSV:
-            record = parse_csv_line(line, assume_utc)
-        else:  # LogFormat.PLAIN_TEXT
-            record = parse_plain_text_line(line, assume_utc)
+        # Parse based on detected format; JSON decoders take bytes directly
+        if format_type == LogFormat.JSON_LINES:
+            record = parse_json_line(line_bytes, assume_utc)
+        else:
+            line = line_bytes.decode('utf-8', errors='ignore')
+            if format_type == LogFormat.STRUCTURED_LOG:
+                record = parse_structured_log_line(line, assume_utc)
+            elif format_type == LogFormat.CSV:
+                record = parse_csv_line(line, assume_utc)
+            else:  # LogFormat.PLAIN_TEXT
+                record = parse_plain_text_line(line, assume_utc)
 
         if record:
             parsed_lines += 1
-            records.append(record)
+            collector.add(record)
         else:
             # Count skipped reasons for diagnostics
-            has_timestamp = any(re.search(r'20\d{2}-\d{2}-\d{2}', line))
+            has_timestamp = _DATE_BYTES_RE.search(line_bytes) is not None
             if has_timestamp:
                 skipped_no_query += 1
             else:
                 skipped_no_timestamp += 1
 
-    return records
+    return collector.result()
+
+
+def _line_aligned_boundaries(file_path: pathlib.Path, size: int, parts: int) -> List[int]:
+    """Split [0, size) into roughly equal byte ranges that start on a line."""
+    boundaries = [0]
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for i in range(1, parts):
+            nl = mm.find(b'\n', max(size * i // parts, boundaries[-1]))
+            if nl < 0:
+                break
+            boundaries.append(nl + 1)
+    boundaries.append(size)
+    return sorted(set(boundaries))
+
+
+def _parse_range(args):
+    """Process-pool worker: parse the lines in one byte range of a file."""
+    path_str, format_value, assume_utc, start, end, columnar = args
+    with open(path_str, 'rb') as f:
+        f.seek(start)
+        chunk = f.read(end - start)
+    return _parse_lines(chunk.split(b'\n'), LogFormat(format_value), assume_utc, columnar)
+
+
+def _parse_file_parallel(file_path: pathlib.Path, size: int, workers: int,
+                         format_type: LogFormat, assume_utc: bool, columnar: bool = False):
+    """Parse a large file by fanning line-aligned byte ranges out to spawned worker processes."""
+    boundaries = _line_aligned_boundaries(file_path, size, workers)
+    tasks = [
+        (str(file_path), format_type.value, assume_utc, start, end, columnar)
+        for start, end in zip(boundaries, boundaries[1:])
+    ]
+    result = {name: [] for name in SEARCH_LOG_COLUMNS} if columnar else []
+    with ProcessPoolExecutor(max_workers=len(tasks), mp_context=_POOL_CONTEXT) as executor:
+        for chunk in executor.map(_parse_range, tasks):
+            if columnar:
+                for name in SEARCH_LOG_COLUMNS:
+                    result[name].extend(chunk[name])
+            else:
+                result.extend(chunk)
+    return result
+
+
+def parse_search_logs_file_arrow(file_path: pathlib.Path, assume_utc: bool = True,
+                                 workers: Optional[int] = None):
+    """Parse search logs file into a columnar pyarrow RecordBatch (timestamp, ip, query).
+
+    Values are collected per column as lines are parsed, so no list of per-row
+    dicts is built. DuckDB can scan the batch directly (e.g. conn.register).
+    workers behaves as in parse_search_logs_file.
+    """
+    import pyarrow as pa  # deferred: only the columnar path pays the import
+
+    columns = _parse_search_logs(file_path, assume_utc, columnar=True, workers=workers)
+    return pa.record_batch(
+        [pa.array(columns[name], type=pa.string()) for name in SEARCH_LOG_COLUMNS],
+        names=SEARCH_LOG_COLUMNS,
+    )
 
 
-def get_parse_statistics(file_path: pathlib.Path, records: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Get parsing statistics for diagnostics."""
+def get_parse_statistics(file_path: pathlib.Path, records) -> Dict[str, Any]:
+    """Get parsing statistics for diagnostics (records: list of dicts or RecordBatch)."""
     try:
         total_lines = sum(1 for _ in file_path.read_text(errors='ignore').splitlines())
     except Exception:
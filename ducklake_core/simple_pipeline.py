@@ -9,9 +9,13 @@ Directory expectations:
 Sources handled initially: page_count, search_logs.
 """
 from __future__ import annotations
-import duckdb, pathlib, hashlib, time, json, sys
+import duckdb, pathlib, hashlib, time, json, sys, os, importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
 from .anomaly import detect_anomalies
+from .config import USER_AGENT_COLUMNS
+from .exceptions import EnrichmentError, ReportGenerationError
+from .sql_loader import load_aggregate_sql, load_sql_file, load_table_sql, load_view_sql
 
 ROOT = pathlib.Path(__file__).resolve().parent.parent
 RAW_DIR = ROOT / 'data' / 'raw'
@@ -59,10 +63,10 @@ def file_id(path: pathlib.Path) -> str:
   """
   h = hashlib.sha256()
   h.update(str(path).encode())
-  # Hash file content instead of mtime for stability
+  # Hash file content instead of mtime for stability; file_digest streams the
+  # file through OpenSSL in fixed-size buffers with the GIL released
   with path.open('rb') as f:
-    h.update(f.read())
-  return h.hexdigest()
+    return hashlib.file_digest(f, lambda: h).hexdigest()
 
 
 def discover_new_files() -> list[tuple[str, date, pathlib.Path]]:
@@ -86,60 +90,79 @@ def discover_new_files() -> list[tuple[str, date, pathlib.Path]]:
 
 def ingest_new_files(conn: duckdb.DuckDBPyConnection):
   LAKE_DIR.mkdir(parents=True, exist_ok=True)
-  new = 0
-  for source, dt_obj, path in discover_new_files():
-    fid = file_id(path)
-    row = conn.execute("SELECT 1 FROM processed_files WHERE file_id=?", [fid]).fetchone()
-    if row:
-      continue
-    # Write per-day parquet partition file if not exists
-    part_dir = LAKE_DIR / source
-    part_dir.mkdir(parents=True, exist_ok=True)
-    parquet_path = part_dir / f"dt={dt_obj}.parquet"
-    try:
-      if parquet_path.exists():
-        # Align schemas by projecting the same column list from both sides
-        existing_cols = [r[0] for r in conn.execute(f"DESCRIBE SELECT * FROM read_parquet('{parquet_path}')").fetchall()]
-        csv_cols = [r[0] for r in conn.execute(f"DESCRIBE SELECT * FROM read_csv_auto('{path}')").fetchall()]
-        csv_set = set(csv_cols)
-        select_existing = ",".join(existing_cols)
-        select_new = ",".join([c if c in csv_set else f"NULL AS {c}" for c in existing_cols])
-        tmp_path = parquet_path.with_suffix('.parquet.tmp')
-        try:
-          if tmp_path.exists():
-            tmp_path.unlink()
-        except Exception:
-          pass
-        conn.execute(
-          f"COPY ((SELECT {select_existing} FROM read_parquet('{parquet_path}')) UNION ALL (SELECT {select_new} FROM read_csv_auto('{path}'))) TO '{tmp_path}' (FORMAT PARQUET)"
-        )
-        try:
-          parquet_path.unlink()
-          tmp_path.rename(parquet_path)
-        except Exception as e:
-          raise RuntimeError(f"Failed replacing parquet partition {parquet_path}: {e}")
-        # Clean up any leftover .parquet.tmp files
-        if tmp_path.exists():
-          try:
-            tmp_path.unlink()
-          except Exception:
-            pass
-        added_rows = conn.execute(f"SELECT COUNT(*) FROM read_csv_auto('{path}')").fetchone()[0]
-      else:
-        conn.execute(f"COPY (SELECT * FROM read_csv_auto('{path}')) TO '{parquet_path}' (FORMAT PARQUET)")
-        added_rows = conn.execute(f"SELECT COUNT(*) FROM read_csv_auto('{path}')").fetchone()[0]
-      conn.execute("INSERT INTO processed_files VALUES (?,?,?,?,?,current_timestamp)", [source, dt_obj, str(path), fid, added_rows])
-      new += 1
-    except Exception as e:
-      print(f"Failed ingest {path}: {e}", file=sys.stderr)
-    # Always try to clean up .parquet.tmp files after each attempt
-    tmp_path = parquet_path.with_suffix('.parquet.tmp')
-    if tmp_path.exists():
+  files = discover_new_files()
+  # One lookup of already-processed ids instead of a SELECT per file
+  processed = {r[0] for r in conn.execute("SELECT file_id FROM processed_files").fetchall()}
+  ingested = 0
+  # Hash on worker threads (hashlib releases the GIL) while this thread ingests;
+  # map() keeps discovery order so partition appends stay deterministic.
+  with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as ex:
+    for (source, dt_obj, path), fid in zip(files, ex.map(file_id, [f[2] for f in files])):
+      if fid in processed:
+        continue
+      row = _ingest_file(conn, source, dt_obj, path, fid)
+      if row:
+        # Record straight after the append: appends aren't idempotent, so a file
+        # appended but not recorded (process killed) would be appended again
+        conn.execute("INSERT INTO processed_files VALUES (?,?,?,?,?,current_timestamp)", row)
+        processed.add(fid)
+        ingested += 1
+  return ingested
+
+
+def _ingest_file(conn: duckdb.DuckDBPyConnection, source: str, dt_obj: date, path: pathlib.Path, fid: str) -> tuple | None:
+  """Append one raw CSV to its lake partition; returns its processed_files row, or None on failure."""
+  ingested = None
+  # Write per-day parquet partition file if not exists
+  part_dir = LAKE_DIR / source
+  part_dir.mkdir(parents=True, exist_ok=True)
+  parquet_path = part_dir / f"dt={dt_obj}.parquet"
+  try:
+    # Parse the CSV once (DuckDB's reader is parallel); schema, copy and row count reuse it
+    conn.execute("CREATE OR REPLACE TEMP TABLE _ingest_csv AS SELECT * FROM read_csv_auto(?)", [str(path)])
+    added_rows = conn.execute("SELECT COUNT(*) FROM _ingest_csv").fetchone()[0]
+    if parquet_path.exists():
+      # Align schemas by projecting the same column list from both sides
+      existing_cols = [r[0] for r in conn.execute(f"DESCRIBE SELECT * FROM read_parquet('{parquet_path}')").fetchall()]
+      csv_cols = [r[0] for r in conn.execute("DESCRIBE _ingest_csv").fetchall()]
+      csv_set = set(csv_cols)
+      select_existing = ",".join(existing_cols)
+      select_new = ",".join([c if c in csv_set else f"NULL AS {c}" for c in existing_cols])
+      tmp_path = parquet_path.with_suffix('.parquet.tmp')
       try:
-        tmp_path.unlink()
+        if tmp_path.exists():
+          tmp_path.unlink()
       except Exception:
         pass
-  return new
+      conn.execute(
+        f"COPY ((SELECT {select_existing} FROM read_parquet('{parquet_path}')) UNION ALL (SELECT {select_new} FROM _ingest_csv)) TO '{tmp_path}' (FORMAT PARQUET)"
+      )
+      try:
+        parquet_path.unlink()
+        tmp_path.rename(parquet_path)
+      except Exception as e:
+        raise RuntimeError(f"Failed replacing parquet partition {parquet_path}: {e}")
+      # Clean up any leftover .parquet.tmp files
+      if tmp_path.exists():
+        try:
+          tmp_path.unlink()
+        except Exception:
+          pass
+    else:
+      conn.execute(f"COPY _ingest_csv TO '{parquet_path}' (FORMAT PARQUET)")
+    ingested = (source, dt_obj, str(path), fid, added_rows)
+  except Exception as e:
+    print(f"Failed ingest {path}: {e}", file=sys.stderr)
+  finally:
+    conn.execute("DROP TABLE IF EXISTS _ingest_csv")
+  # Always try to clean up .parquet.tmp files after each attempt
+  tmp_path = parquet_path.with_suffix('.parquet.tmp')
+  if tmp_path.exists():
+    try:
+      tmp_path.unlink()
+    except Exception:
+      pass
+  return ingested
 
 
 def create_lake_views(conn: duckdb.DuckDBPyConnection):
@@ -163,81 +186,108 @@ def create_lake_views(conn: duckdb.DuckDBPyConnection):
       )
 
 
-def update_daily_aggregates(conn: duckdb.DuckDBPyConnection):
-  # Page views daily
-  max_dt_row = conn.execute("SELECT COALESCE(max(dt), DATE '1970-01-01') FROM page_views_daily").fetchone()
-  max_dt = max_dt_row[0]
-  # Always use COALESCE for all likely timestamp columns
+def _table_columns(conn: duckdb.DuckDBPyConnection, name: str) -> list[str]:
+  # Use DESCRIBE to get real column names; fallback to PRAGMA if needed
   try:
-    cols = [r[0] for r in conn.execute("DESCRIBE lake_page_count").fetchall()]
+    return [r[0] for r in conn.execute(f"DESCRIBE {name}").fetchall()]
   except Exception:
-    cols = [r[1] for r in conn.execute("PRAGMA table_info('lake_page_count')").fetchall()]
+    # PRAGMA table_info returns (cid, name, type, notnull, dflt_value, pk)
+    return [r[1] for r in conn.execute(f"PRAGMA table_info('{name}')").fetchall()]
+
+
+def update_page_views_daily(conn: duckdb.DuckDBPyConnection):
+  """Aggregate new days of lake_page_count into page_views_daily in one statement."""
+  cols = _table_columns(conn, 'lake_page_count')
   # Build COALESCE expression for all present timestamp columns
   candidates = [c for c in ('timestamp', 'event_ts', 'time') if c in cols]
   if candidates:
-    coalesce_expr = f"COALESCE({', '.join(candidates)})"
-    conn.execute(f"""
-      INSERT OR REPLACE INTO page_views_daily
-      SELECT date({coalesce_expr}) AS dt,
-             count(*) AS views,
-             count(DISTINCT ip) AS uniq_ips
-      FROM lake_page_count
-      WHERE {coalesce_expr} IS NOT NULL AND date({coalesce_expr}) > ?
-      GROUP BY 1
-    """, [max_dt])
+    conn.execute(load_aggregate_sql('page_views_daily_insert', coalesce_expr=f"COALESCE({', '.join(candidates)})"))
   elif 'dt' in cols:
-    conn.execute("""
-      INSERT OR REPLACE INTO page_views_daily
-      SELECT dt,
-             count(*) AS views,
-             count(DISTINCT ip) AS uniq_ips
-      FROM lake_page_count
-      WHERE dt > ?
-      GROUP BY 1
-    """, [max_dt])
-  # Searches daily (dynamic column detection: prefer timestamp, else dt already present)
-  # We'll rebuild searches for new days only; if logic changes to full rebuild set full_rebuild=True
-  max_s_dt = conn.execute("SELECT COALESCE(max(dt), DATE '1970-01-01') FROM searches_daily").fetchone()[0]
-  # Use DESCRIBE to get real column names; fallback to PRAGMA if needed
-  try:
-    cols = [r[0] for r in conn.execute("DESCRIBE lake_search_logs").fetchall()]
-  except Exception:
-    # PRAGMA table_info returns (cid, name, type, notnull, dflt_value, pk)
-    cols = [r[1] for r in conn.execute("PRAGMA table_info('lake_search_logs')").fetchall()]
-  time_col = None
-  for candidate in ('timestamp', 'event_ts'):
-    if candidate in cols:
-      time_col = candidate
-      break
+    conn.execute(load_aggregate_sql('page_views_daily_insert_dt'))
+
+
+def update_searches_daily(conn: duckdb.DuckDBPyConnection):
+  """Aggregate new days of lake_search_logs into searches_daily in one statement."""
+  cols = _table_columns(conn, 'lake_search_logs')
+  # Prefer a timestamp column; else assume dt already present (partition produced only dt + query + ip etc.)
+  time_col = next((c for c in ('timestamp', 'event_ts') if c in cols), None)
   if time_col:
-    conn.execute(f"""
-      INSERT OR REPLACE INTO searches_daily
-      SELECT date({time_col}) AS dt,
-        lower(trim(regexp_replace(query, '\\s+', ' '))) AS query,
-        count(*) AS cnt
-      FROM lake_search_logs
-      WHERE {time_col} IS NOT NULL
-        AND query IS NOT NULL
-        AND length(trim(query))>0
-        AND lower(trim(query)) <> 'null'
-        AND length(lower(trim(regexp_replace(query, '\\s+', ' ')))) > 1
-        AND date({time_col}) > ?
-      GROUP BY 1,2
-    """, [max_s_dt])
-  else:
-    # Fallback: assume dt column exists already (partition produced only dt + query + ip etc.)
-    if 'dt' in cols:
-      conn.execute("""
-        INSERT OR REPLACE INTO searches_daily
-        SELECT dt, lower(trim(regexp_replace(query, '\\s+', ' '))) AS query, count(*) AS cnt
-        FROM lake_search_logs
-        WHERE dt > ?
-          AND query IS NOT NULL
-          AND length(trim(query))>0
-          AND lower(trim(query)) <> 'null'
-          AND length(lower(trim(regexp_replace(query, '\\s+', ' ')))) > 1
-        GROUP BY 1,2
-      """, [max_s_dt])
+    conn.execute(load_aggregate_sql('searches_daily_insert', time_col=time_col))
+  elif 'dt' in cols:
+    conn.execute(load_aggregate_sql('searches_daily_insert_dt'))
+
+
+def update_daily_aggregates(conn: duckdb.DuckDBPyConnection):
+  update_page_views_daily(conn)
+  update_searches_daily(conn)
+
+
+def _page_count_dt_expr(cols: list[str]) -> str:
+  if 'timestamp' in cols:
+    return "CAST(TRY_CAST(p.timestamp AS TIMESTAMP) AS DATE)"
+  if 'dt' in cols:
+    return "TRY_CAST(p.dt AS DATE)"
+  return "CAST(NULL AS DATE)"
+
+
+def _silver_page_count_params(cols: list[str]) -> dict[str, str]:
+  """Template parameters shared by the silver_page_count table and view SQL for lake_page_count's columns."""
+  replaced = [c for c in USER_AGENT_COLUMNS + ['dt'] if c in cols]
+  page_columns = f"p.* EXCLUDE ({', '.join(replaced)})" if replaced else "p.*"
+  return {'page_columns': page_columns, 'dt_expr': _page_count_dt_expr(cols)}
+
+
+def _drop_silver_page_count(conn: duckdb.DuckDBPyConnection):
+  """Drop silver_page_count whether it is currently a table or the empty-schema view."""
+  row = conn.execute("SELECT table_type FROM information_schema.tables WHERE table_name='silver_page_count'").fetchone()
+  if row:
+    conn.execute(f"DROP {'VIEW' if row[0] == 'VIEW' else 'TABLE'} silver_page_count")
+
+
+def enrich_page_count_data(conn: duckdb.DuckDBPyConnection):
+  """Create silver_page_count: lake_page_count plus parsed user agent columns.
+
+  With the user_agents library installed, each distinct user agent is parsed once
+  into the silver_user_agents lookup table and joined back in SQL; the result is
+  materialized as a TABLE (sql/tables/silver_page_count_enriched.sql). Without the
+  library, silver_page_count is a VIEW applying heuristic regexes in DuckDB
+  (sql/views/silver_page_count_heuristic.sql); with no user agents it is a VIEW of
+  NULL enrichment columns. Readers see the same columns either way.
+  """
+  try:
+    try:
+      cols = [r[0] for r in conn.execute("DESCRIBE lake_page_count").fetchall()]
+    except Exception:
+      cols = []
+    if 'user_agent' not in cols:
+      # No user_agent column; still expose expected enrichment columns (NULL) so reports don't break
+      _drop_silver_page_count(conn)
+      conn.execute(load_view_sql('silver_page_count_empty'))
+      return
+    if importlib.util.find_spec('user_agents') is None:
+      # Heuristic rules run as DuckDB regexes over the lake; no pandas round trip
+      _drop_silver_page_count(conn)
+      conn.execute(load_view_sql('silver_page_count_heuristic', **_silver_page_count_params(cols)))
+    else:
+      # pandas-backed enricher is imported only once there are user agents to parse,
+      # so empty and no-user_agent refreshes never pay the pandas import
+      from .user_agent_enricher import enrich_user_agents
+      distinct_uas = conn.execute("SELECT DISTINCT user_agent FROM lake_page_count").df()
+      if distinct_uas.empty:
+        _drop_silver_page_count(conn)
+        conn.execute(load_view_sql('silver_page_count_empty'))
+        return
+      parsed = enrich_user_agents(distinct_uas)
+      conn.register('_parsed_user_agents', parsed)
+      try:
+        conn.execute("CREATE OR REPLACE TABLE silver_user_agents AS SELECT * FROM _parsed_user_agents")
+      finally:
+        conn.unregister('_parsed_user_agents')
+      # Materialized once so aggregates and reports scan stored columns instead of re-joining
+      _drop_silver_page_count(conn)
+      conn.execute(load_table_sql('silver_page_count_enriched', **_silver_page_count_params(cols)))
+  except Exception as e:
+    raise EnrichmentError(f"Failed to enrich page_count data: {e}")
 
 
 def validate_simple_pipeline(conn: duckdb.DuckDBPyConnection) -> dict:
@@ -292,33 +342,47 @@ def _dynamic_busiest_hours_sql(conn: duckdb.DuckDBPyConnection):
   return None
 
 
+# (directory, per-file mtimes) generation and the report dict built for it
+_REPORTS_CACHE: tuple[tuple, dict[str, str]] | None = None
+
+# Reports pre-cleaned by scripts/compile_sql.py; absent in a plain checkout
+try:
+  from ._compiled_reports import REPORTS as _COMPILED_REPORTS, SOURCES as _COMPILED_SOURCES
+except ImportError:
+  _COMPILED_REPORTS, _COMPILED_SOURCES = None, None
+
+
 def load_sql_reports() -> dict[str, str]:
-  """Load all SQL report files and return dict mapping report name to SQL content."""
-  reports = {}
+  """Load all SQL report files and return dict mapping report name to SQL content.
+
+  Uses the compiled reports module when sql/reports/ is absent or unchanged since it
+  was generated. The result is reused until a report file is added, removed or modified.
+  """
+  global _REPORTS_CACHE
   if not SQL_REPORTS_DIR.exists():
-    return reports
-  
-  for sql_file in SQL_REPORTS_DIR.glob('*.sql'):
-    report_name = sql_file.stem
+    return dict(_COMPILED_REPORTS) if _COMPILED_REPORTS is not None else {}
+  with os.scandir(SQL_REPORTS_DIR) as it:
+    entries = sorted((e for e in it if e.name.endswith('.sql') and e.is_file()), key=lambda e: e.name)
+  generation = (str(SQL_REPORTS_DIR), tuple((e.name, e.stat().st_mtime_ns) for e in entries))
+  if _REPORTS_CACHE is not None and _REPORTS_CACHE[0] == generation:
+    return dict(_REPORTS_CACHE[1])
+  if _COMPILED_REPORTS is not None and _COMPILED_SOURCES == generation[1]:
+    _REPORTS_CACHE = (generation, dict(_COMPILED_REPORTS))
+    return dict(_COMPILED_REPORTS)
+
+  reports = {}
+  for entry in entries:
+    sql_file = pathlib.Path(entry.path)
     try:
-      sql_content = sql_file.read_text().strip()
-      # Remove comments for cleaner SQL
-      lines = []
-      for line in sql_content.split('\n'):
-        if not line.strip().startswith('--'):
-          lines.append(line)
-      clean_sql = '\n'.join(lines).strip()
-      
-      # Remove trailing semicolon if present (DuckDB COPY doesn't like it)
-      if clean_sql.endswith(';'):
-        clean_sql = clean_sql[:-1].strip()
-      
+      # load_sql_file strips comments and the trailing semicolon (DuckDB COPY doesn't like it)
+      clean_sql = load_sql_file(sql_file)
       if clean_sql:
-        reports[report_name] = clean_sql
+        reports[sql_file.stem] = clean_sql
     except Exception as e:
       print(f"[WARN] Failed to load SQL report {sql_file}: {e}")
-  
-  return reports
+
+  _REPORTS_CACHE = (generation, reports)
+  return dict(reports)
 
 
 def create_report_view(conn: duckdb.DuckDBPyConnection, report_name: str, sql: str) -> bool:
@@ -332,17 +396,55 @@ def create_report_view(conn: duckdb.DuckDBPyConnection, report_name: str, sql: s
     return False
 
 
-def run_simple_reports(conn: duckdb.DuckDBPyConnection):
-  REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+def create_report_views(conn: duckdb.DuckDBPyConnection, reports: dict[str, str]) -> dict[str, bool]:
+  """Create v_<report> views for all reports in one script; per-view fallback on failure."""
+  if not reports:
+    return {}
+  script = ';\n'.join(f"CREATE OR REPLACE VIEW v_{name} AS {sql}" for name, sql in reports.items())
+  try:
+    conn.execute(script)
+    return {f"v_{name}": True for name in reports}
+  except Exception:
+    # Redo one by one so each failing view is reported individually
+    return {f"v_{name}": create_report_view(conn, name, sql) for name, sql in reports.items()}
+
+
+def _uses_connection_state(conn: duckdb.DuckDBPyConnection) -> bool:
+  """True if conn has an open transaction or TEMP objects that other cursors can't see."""
+  # Autocommit gives every statement a new transaction id; an open transaction keeps its id
+  in_transaction = conn.execute("SELECT txid_current()").fetchone()[0] == conn.execute("SELECT txid_current()").fetchone()[0]
+  if in_transaction:
+    return True
+  return conn.execute("""
+    SELECT (SELECT count(*) FROM duckdb_tables() WHERE temporary)
+         + (SELECT count(*) FROM duckdb_views() WHERE temporary AND NOT internal) > 0
+  """).fetchone()[0]
+
+
+def run_simple_reports(conn: duckdb.DuckDBPyConnection, reports_dir: pathlib.Path | None = None,
+                       params: dict | None = None, report_params: dict[str, tuple[str, ...]] | None = None):
+  """Export every SQL report to <reports_dir>/<name>.csv (default REPORTS_DIR) and create its v_<name> view.
+
+  report_params declares the $name parameters each report binds; their values come from
+  params and are bound by DuckDB rather than interpolated. Parameterized reports get no
+  view (views can't bind). Exports run in parallel on cursors unless conn has an open
+  transaction or TEMP objects, in which case they run sequentially on conn itself.
+  """
+  reports_dir = reports_dir or REPORTS_DIR
+  params = params or {}
+  report_params = report_params or {}
+  reports_dir.mkdir(parents=True, exist_ok=True)
   out = {}
   views_created = {}
+  view_sql = {}
   
   # Load all SQL reports from files
   sql_reports = load_sql_reports()
   
+  exports = {}
   for report_name, sql in sql_reports.items():
     csv_filename = f"{report_name}.csv"
-    target = REPORTS_DIR / csv_filename
+    target = reports_dir / csv_filename
     effective_sql = sql
     
     # Handle special cases that need dynamic column detection
@@ -354,31 +456,66 @@ def run_simple_reports(conn: duckdb.DuckDBPyConnection):
         views_created[f"v_{report_name}"] = False
         continue
       effective_sql = dyn
-    
+    out[csv_filename] = 0
+    exports[report_name] = (effective_sql, tuple(report_params.get(report_name, ())))
+  
+  # Reports are independent, so COPYs run concurrently on per-thread cursors
+  # (DuckDB releases the GIL while executing). Cursors are separate connections,
+  # so fall back to conn itself when they couldn't see what the caller sees.
+  shared = _uses_connection_state(conn)
+
+  def export(item):
+    report_name, (effective_sql, param_names) = item
+    target = reports_dir / f"{report_name}.csv"
     try:
-      # Create CSV report
-      conn.execute(f"COPY ({effective_sql}) TO '{target}' (HEADER TRUE, DELIMITER ',')")
-      rows = sum(1 for _ in target.open()) - 1 if target.exists() else 0
-      out[csv_filename] = rows
-      
-      # Create DuckDB view for dashboard integration
-      view_created = create_report_view(conn, report_name, effective_sql)
-      views_created[f"v_{report_name}"] = view_created
-      
+      # The COPY text is constant per report; only bound values vary between runs
+      missing = [n for n in param_names if n not in params]
+      if missing:
+        raise ReportGenerationError(f"missing report parameter {', '.join(missing)} for {report_name}")
+      bound = {n: params[n] for n in param_names}
+      bound['_target'] = str(target)
+      copy_sql = f"COPY ({effective_sql}) TO $_target (HEADER TRUE, DELIMITER ',')"
+      if shared:
+        rows = conn.execute(copy_sql, bound).fetchone()[0]
+      else:
+        with conn.cursor() as cur:
+          rows = cur.execute(copy_sql, bound).fetchone()[0]
+      return report_name, rows, None
     except Exception as e:
-      print(f"[WARN] report {csv_filename} failed: {e}")
+      return report_name, 0, e
+  
+  if shared:
+    results = [export(item) for item in exports.items()]
+  else:
+    with ThreadPoolExecutor(max_workers=min(len(exports), os.cpu_count() or 1) or 1) as ex:
+      results = list(ex.map(export, exports.items()))
+  
+  for report_name, rows, error in results:
+    csv_filename = f"{report_name}.csv"
+    if error is None:
+      out[csv_filename] = rows
+      effective_sql, param_names = exports[report_name]
+      if param_names:
+        views_created[f"v_{report_name}"] = False
+      else:
+        view_sql[report_name] = effective_sql
+    else:
+      print(f"[WARN] report {csv_filename} failed: {error}")
+      target = reports_dir / csv_filename
       if not target.exists():
         target.write_text('col\n')  # Generic fallback header
-      out[csv_filename] = 0
       views_created[f"v_{report_name}"] = False
   
+  # Create DuckDB views for dashboard integration
+  views_created.update(create_report_views(conn, view_sql))
+  
   # Generate summary with both CSV and view information
   summary = {
     'generated_reports': out,
     'created_views': views_created,
     'ts': datetime.utcnow().isoformat()+'Z'
   }
-  (REPORTS_DIR / 'simple_refresh_summary.json').write_text(json.dumps(summary, indent=2))
+  (reports_dir / 'simple_refresh_summary.json').write_text(json.dumps(summary, indent=2))
 
 
 def simple_refresh(conn: duckdb.DuckDBPyConnection):
@@ -391,102 +528,11 @@ def simple_refresh(conn: duckdb.DuckDBPyConnection):
   # Lake views
   print("[progress] Creating lake views...", file=sys.stderr, flush=True)
   p0 = time.time(); create_lake_views(conn); phases['lake_views_s'] = round(time.time()-p0, 3)
-  # Silver enrichment (user_agent parsing) for page_count via pandas
+  # Silver enrichment (user_agent parsing) for page_count
   p0 = time.time()
   try:
-    import pandas as pd
-    try:
-      cols = [r[0] for r in conn.execute("DESCRIBE lake_page_count").fetchall()]
-    except Exception:
-      cols = []
-    if 'user_agent' in cols:
-      df = conn.execute("SELECT * FROM lake_page_count").df()
-      if not df.empty:
-        try:
-          import user_agents  # type: ignore
-          parsed = df['user_agent'].fillna('').map(lambda ua: user_agents.parse(ua))
-          df['agent_type'] = parsed.map(lambda o: 'bot' if o.is_bot else 'human')
-          df['os'] = parsed.map(lambda o: o.os.family or 'unknown')
-          df['os_version'] = parsed.map(lambda o: o.os.version_string or '')
-          df['browser'] = parsed.map(lambda o: o.browser.family or 'unknown')
-          df['browser_version'] = parsed.map(lambda o: o.browser.version_string or '')
-          df['device'] = parsed.map(lambda o: o.device.family or 'unknown')
-          df['is_mobile'] = parsed.map(lambda o: int(o.is_mobile))
-          df['is_tablet'] = parsed.map(lambda o: int(o.is_tablet))
-          df['is_pc'] = parsed.map(lambda o: int(o.is_pc))
-          df['is_bot'] = parsed.map(lambda o: int(o.is_bot))
-        except Exception:
-          # Fallback heuristic
-            def _fallback_parse(ua: str):
-              if not ua: return ('unknown','unknown','', 'unknown','', 'unknown',0,0,0,0)
-              u = ua.lower()
-              agent_type = 'bot' if any(x in u for x in ['bot','spider','crawl']) else 'human'
-              os_name = 'windows' if 'windows' in u else ('android' if 'android' in u else ('linux' if 'linux' in u else ('mac' if 'mac os' in u or 'macintosh' in u else 'unknown')))
-              browser = 'chrome' if 'chrome/' in u else ('firefox' if 'firefox/' in u else ('safari' if 'safari/' in u else 'unknown'))
-              device = 'mobile' if 'mobile' in u else ('tablet' if 'tablet' in u else ('pc' if os_name in ('windows','linux','mac') else 'unknown'))
-              is_mobile = 1 if device=='mobile' else 0
-              is_tablet = 1 if device=='tablet' else 0
-              is_pc = 1 if device=='pc' else 0
-              is_bot = 1 if agent_type=='bot' else 0
-              return (agent_type, os_name, '', browser, '', device, is_mobile, is_tablet, is_pc, is_bot)
-            parsed = df['user_agent'].fillna('').map(_fallback_parse)
-            df['agent_type'] = parsed.map(lambda t: t[0])
-            df['os'] = parsed.map(lambda t: t[1])
-            df['os_version'] = parsed.map(lambda t: t[2])
-            df['browser'] = parsed.map(lambda t: t[3])
-            df['browser_version'] = parsed.map(lambda t: t[4])
-            df['device'] = parsed.map(lambda t: t[5])
-            df['is_mobile'] = parsed.map(lambda t: t[6])
-            df['is_tablet'] = parsed.map(lambda t: t[7])
-            df['is_pc'] = parsed.map(lambda t: t[8])
-            df['is_bot'] = parsed.map(lambda t: t[9])
-        # Derive dt
-        if 'timestamp' in df.columns:
-          df['dt'] = pd.to_datetime(df['timestamp'], errors='coerce').dt.date
-        elif 'dt' in df.columns:
-          df['dt'] = pd.to_datetime(df['dt'], errors='coerce').dt.date
-        else:
-          df['dt'] = None
-        silver_dir = (ROOT / 'silver' / 'page_count')
-        silver_dir.mkdir(parents=True, exist_ok=True)
-        out_path = silver_dir / 'page_count_enriched.parquet'
-        df.to_parquet(out_path, index=False)
-        conn.execute(f"CREATE OR REPLACE VIEW silver_page_count AS SELECT * FROM read_parquet('{out_path}', union_by_name=true)")
-      else:
-        # Empty dataframe; create a zero-row view with expected enrichment columns present
-        conn.execute("""
-          CREATE OR REPLACE VIEW silver_page_count AS
-          SELECT *,
-            CAST(NULL AS VARCHAR) AS agent_type,
-            CAST(NULL AS VARCHAR) AS os,
-            CAST(NULL AS VARCHAR) AS os_version,
-            CAST(NULL AS VARCHAR) AS browser,
-            CAST(NULL AS VARCHAR) AS browser_version,
-            CAST(NULL AS VARCHAR) AS device,
-            CAST(NULL AS INTEGER) AS is_mobile,
-            CAST(NULL AS INTEGER) AS is_tablet,
-            CAST(NULL AS INTEGER) AS is_pc,
-            CAST(NULL AS INTEGER) AS is_bot
-          FROM lake_page_count WHERE 0=1
-        """)
-    else:
-      # No user_agent column; still expose expected enrichment columns (NULL) so reports don't break
-      conn.execute("""
-        CREATE OR REPLACE VIEW silver_page_count AS
-        SELECT *,
-          CAST(NULL AS VARCHAR) AS agent_type,
-          CAST(NULL AS VARCHAR) AS os,
-          CAST(NULL AS VARCHAR) AS os_version,
-          CAST(NULL AS VARCHAR) AS browser,
-          CAST(NULL AS VARCHAR) AS browser_version,
-          CAST(NULL AS VARCHAR) AS device,
-          CAST(NULL AS INTEGER) AS is_mobile,
-          CAST(NULL AS INTEGER) AS is_tablet,
-          CAST(NULL AS INTEGER) AS is_pc,
-          CAST(NULL AS INTEGER) AS is_bot
-        FROM lake_page_count WHERE 0=1
-      """)
-  except Exception as e:
+    enrich_page_count_data(conn)
+  except EnrichmentError as e:
     print(f"[WARN] Silver enrichment failed: {e}")
   phases['silver_enrich_s'] = round(time.time()-p0, 3)
   # Aggregates
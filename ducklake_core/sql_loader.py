@@ -1,33 +1,140 @@
 """SQL file loading utilities for maintaining SQL in separate files."""
 from __future__ import annotations
+import os
 import pathlib
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional
 from .exceptions import DatabaseOperationError
 
+# {name} parameter placeholders in SQL templates
+_PARAM_RE = re.compile(r'\{(\w+)\}')
+
+
+def _clean_template(text: str) -> tuple[str, tuple[str, ...]]:
+    """Strip comments and the trailing semicolon; return the SQL and its split tokens.
+
+    Tokens alternate literal text and placeholder names (odd indices are names),
+    so substitution is a join rather than a re-scan of the SQL.
+    """
+    sql = _strip_comments(text).strip()
+
+    # Remove trailing semicolon if present (DuckDB COPY doesn't like it)
+    sql = sql.rstrip(';').rstrip()
+    return sql, tuple(_PARAM_RE.split(sql))
+
+
+def _substitute(sql: str, tokens: tuple[str, ...], params: dict, source: str) -> str:
+    """Fill {name} placeholders (templates without placeholders are returned as-is)."""
+    if params and len(tokens) > 1:
+        missing = set(tokens[1::2]) - params.keys()
+        if missing:
+            raise DatabaseOperationError(f"Failed to load SQL {source}: missing parameters {sorted(missing)}")
+        sql = ''.join(tok if i % 2 == 0 else str(params[tok]) for i, tok in enumerate(tokens))
+    return sql
+
+
+def clean_sql(text: str, **params) -> str:
+    """Clean SQL text (comments, trailing semicolon) and substitute parameters."""
+    sql, tokens = _clean_template(text)
+    return _substitute(sql, tokens, params, 'text')
+
+
+# Cleaned templates by path, with the mtime and size they were read at; an edit replaces the entry
+_TEMPLATE_CACHE: Dict[str, tuple[int, int, tuple[str, tuple[str, ...]]]] = {}
+
+
+def _cached_template(path: str, mtime_ns: int, size: int) -> Optional[tuple[str, tuple[str, ...]]]:
+    hit = _TEMPLATE_CACHE.get(path)
+    if hit is not None and hit[0] == mtime_ns and hit[1] == size:
+        return hit[2]
+    return None
+
+
+def _read_and_clean(path: str, mtime_ns: int, size: int) -> tuple[str, tuple[str, ...]]:
+    """Read and clean a SQL file.
+
+    Cached on the file's mtime and size so edits invalidate the cached text.
+    """
+    cleaned = _cached_template(path, mtime_ns, size)
+    if cleaned is None:
+        # Bytes + one decode skips the text I/O wrapper; CRLF is folded as read_text would
+        text = pathlib.Path(path).read_bytes().decode('utf-8').replace('\r\n', '\n')
+        cleaned = _clean_template(text)
+        _TEMPLATE_CACHE[path] = (mtime_ns, size, cleaned)
+    return cleaned
+
+
+# Tokens that change lexical state outside string literals
+_LEXER_RE = re.compile(r"--|/\*|'|\"|\$(?:[A-Za-z_]\w*)?\$")
+# End of an E'...' string: an unescaped quote (backslash escapes the next char)
+_ESCAPE_STRING_END_RE = re.compile(r"\\.|'", re.DOTALL)
+
+
+def _strip_comments(text: str) -> str:
+    """Remove -- comments in a single linear pass.
+
+    -- inside string literals, $$/$tag$ dollar-quoted strings, quoted identifiers and
+    /* */ block comments is kept (block comments themselves are left for DuckDB), and
+    E'...' strings honour backslash escapes. Comment-only lines become empty lines so line structure is preserved.
+    """
+    if '--' not in text:
+        return text
+    out = []
+    start = pos = 0
+    n = len(text)
+    while True:
+        m = _LEXER_RE.search(text, pos)
+        if m is None:
+            break
+        tok, i = m.group(), m.start()
+        if tok == '--':
+            end = text.find('\n', i)
+            end = n if end < 0 else end
+            out.append(text[start:i].rstrip(' \t'))
+            start = pos = end
+        elif tok == '/*':
+            end = text.find('*/', i + 2)
+            pos = n if end < 0 else end + 2
+        elif tok[0] == '$':
+            # Dollar-quoted string: runs to the next identical $tag$
+            end = text.find(tok, m.end())
+            pos = n if end < 0 else end + len(tok)
+        elif tok == "'" and i > 0 and text[i - 1] in 'eE' and (i < 2 or not (text[i - 2].isalnum() or text[i - 2] == '_')):
+            pos = i + 1
+            while True:
+                e = _ESCAPE_STRING_END_RE.search(text, pos)
+                if e is None:
+                    pos = n
+                    break
+                pos = e.end()
+                if e.group() == "'":
+                    break
+        else:
+            # '' and "" escapes close and reopen the literal, which scans the same
+            end = text.find(tok, i + 1)
+            pos = n if end < 0 else end + 1
+        if pos >= n:
+            break
+    out.append(text[start:])
+    return ''.join(out)
+
+
+def _load_sql(sql_path: pathlib.Path, st: os.stat_result, params: dict) -> str:
+    try:
+        sql, tokens = _read_and_clean(str(sql_path), st.st_mtime_ns, st.st_size)
+    except Exception as e:
+        raise DatabaseOperationError(f"Failed to load SQL file {sql_path}: {e}")
+    return _substitute(sql, tokens, params, f"file {sql_path}")
+
 
 def load_sql_file(sql_path: pathlib.Path, **params) -> str:
     """Load SQL file and substitute parameters."""
     try:
-        sql_content = sql_path.read_text().strip()
-
-        # Remove comments for cleaner SQL
-        lines = []
-        for line in sql_content.split('\n'):
-            if not line.strip().startswith('--'):
-                lines.append(line)
-        clean_sql = '\n'.join(lines).strip()
-
-        # Remove trailing semicolon if present (DuckDB COPY doesn't like it)
-        if clean_sql.endswith(';'):
-            clean_sql = clean_sql[:-1].strip()
-
-        # Substitute parameters
-        if params:
-            clean_sql = clean_sql.format(**params)
-
-        return clean_sql
-    except Exception as e:
+        st = sql_path.stat()
+    except OSError as e:
         raise DatabaseOperationError(f"Failed to load SQL file {sql_path}: {e}")
+    return _load_sql(sql_path, st, params)
 
 
 def load_schema_sql(sql_dir: pathlib.Path) -> Dict[str, str]:
@@ -36,9 +143,19 @@ def load_schema_sql(sql_dir: pathlib.Path) -> Dict[str, str]:
     if not sql_dir.exists():
         return schema_files
 
-    for sql_file in sql_dir.glob('*.sql'):
-        schema_files[sql_file.stem] = load_sql_file(sql_file)
+    # scandir yields each entry's type without a syscall on most filesystems;
+    # DirEntry.stat() is still one stat call per file on POSIX
+    with os.scandir(sql_dir) as it:
+        files = [(pathlib.Path(e.path), e.stat()) for e in it if e.name.endswith('.sql') and e.is_file()]
+
+    # File reads release the GIL, so templates missing from the cache are read concurrently
+    misses = [(path, st) for path, st in files if _cached_template(str(path), st.st_mtime_ns, st.st_size) is None]
+    if len(misses) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(misses))) as executor:
+            list(executor.map(lambda f: _load_sql(f[0], f[1], {}), misses))
 
+    for path, st in files:
+        schema_files[path.stem] = _load_sql(path, st, {})
     return schema_files
 
 
@@ -60,6 +177,12 @@ def load_view_sql(view_name: str, **params) -> str:
     return load_sql_file(sql_path, **params)
 
 
+def load_table_sql(table_name: str, **params) -> str:
+    """Load specific materialized-table SQL file with parameter substitution."""
+    sql_path = get_sql_path(f'tables/{table_name}.sql')
+    return load_sql_file(sql_path, **params)
+
+
 def load_schema_sql_file(schema_name: str) -> str:
     """Load specific schema SQL file."""
     sql_path = get_sql_path(f'schema/{schema_name}.sql')
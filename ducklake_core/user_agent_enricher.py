@@ -3,12 +3,42 @@
 Provides clean separation between library-based parsing and fallback heuristics.
 """
 from __future__ import annotations
+import functools
+import re
+import numpy as np
 import pandas as pd
-
-# User agent enrichment column names for consistency
-USER_AGENT_COLUMNS = [
-    'agent_type', 'os', 'os_version', 'browser', 'browser_version',
-    'device', 'is_mobile', 'is_tablet', 'is_pc', 'is_bot'
+from .config import USER_AGENT_COLUMNS
+
+try:
+    import hyperscan  # optional: single-pass multi-pattern scanning
+except ImportError:
+    hyperscan = None
+
+# Heuristic patterns, checked in order; the first match names the field
+_BOT_RE = re.compile(r'bot|spider|crawl', re.IGNORECASE)
+_OS_PATTERNS = {
+    'windows': re.compile(r'windows', re.IGNORECASE),
+    'android': re.compile(r'android', re.IGNORECASE),
+    'linux': re.compile(r'linux', re.IGNORECASE),
+    'mac': re.compile(r'mac os|macintosh', re.IGNORECASE),
+}
+_BROWSER_PATTERNS = {
+    'chrome': re.compile(r'chrome/', re.IGNORECASE),
+    'firefox': re.compile(r'firefox/', re.IGNORECASE),
+    'safari': re.compile(r'safari/', re.IGNORECASE),
+}
+_DEVICE_PATTERNS = {
+    'mobile': re.compile(r'mobile', re.IGNORECASE),
+    'tablet': re.compile(r'tablet', re.IGNORECASE),
+}
+# Without a mobile/tablet marker, desktop operating systems imply a pc
+_PC_OSES = ['windows', 'linux', 'mac']
+
+# Flattened (field, value, pattern) list; a pattern's index is its match id
+_HEURISTIC_PATTERNS = [('agent_type', 'bot', _BOT_RE)] + [
+    (field, value, pattern)
+    for field, patterns in (('os', _OS_PATTERNS), ('browser', _BROWSER_PATTERNS), ('device', _DEVICE_PATTERNS))
+    for value, pattern in patterns.items()
 ]
 
 
@@ -17,7 +47,8 @@ def enrich_user_agents(df: pd.DataFrame, user_agent_column: str = 'user_agent')
 
     First attempts library-based parsing, falls back to heuristics if library unavailable.
     """
-    if user_agent_column not in df.columns or df.empty:
+    # Nothing to parse: skip the parser import and pattern work entirely
+    if user_agent_column not in df.columns or len(df) == 0:
         return add_empty_user_agent_columns(df)
 
     try:
@@ -26,106 +57,137 @@ def enrich_user_agents(df: pd.DataFrame, user_agent_column: str = 'user_agent')
         return parse_with_heuristics(df, user_agent_column)
 
 
-def parse_with_library(df: pd.DataFrame, user_agent_column: str) -> pd.DataFrame:
-    """Parse user agents using the user_agents library."""
+@functools.lru_cache(maxsize=None)
+def _get_ua_parser():
+    """Import user_agents once per process and return its parse function."""
     import user_agents  # type: ignore
+    return user_agents.parse
+
 
-    parsed = df[user_agent_column].fillna('').map(lambda ua: user_agents.parse(ua))
+def parse_with_library(df: pd.DataFrame, user_agent_column: str) -> pd.DataFrame:
+    """Parse user agents using the user_agents library.
 
-    df['agent_type'] = parsed.map(lambda o: 'bot' if o.is_bot else 'human')
-    df['os'] = parsed.map(lambda o: o.os.family or 'unknown')
-    df['os_version'] = parsed.map(lambda o: o.os.version_string or '')
-    df['browser'] = parsed.map(lambda o: o.browser.family or 'unknown')
-    df['browser_version'] = parsed.map(lambda o: o.browser.version_string or '')
-    df['device'] = parsed.map(lambda o: o.device.family or 'unknown')
-    df['is_mobile'] = parsed.map(lambda o: int(o.is_mobile))
-    df['is_tablet'] = parsed.map(lambda o: int(o.is_tablet))
-    df['is_pc'] = parsed.map(lambda o: int(o.is_pc))
-    df['is_bot'] = parsed.map(lambda o: int(o.is_bot))
+    Log traffic repeats a small set of agent strings, so each distinct string
+    is parsed once and the results are broadcast back by factorized code.
+    """
+    parse = _get_ua_parser()
 
-    return df
+    codes, uniques = pd.factorize(df[user_agent_column].fillna(''))
+    parsed = pd.DataFrame([_library_fields(parse(ua)) for ua in uniques], columns=USER_AGENT_COLUMNS)
+    for col in USER_AGENT_COLUMNS:
+        values = parsed[col].to_numpy()[codes]
+        df[col] = values.astype('int8') if col.startswith('is_') else values
 
+    return df
 
-def parse_with_heuristics(df: pd.DataFrame, user_agent_column: str) -> pd.DataFrame:
-    """Parse user agents using simple heuristics when library unavailable."""
-    parsed = df[user_agent_column].fillna('').map(_heuristic_parse)
 
-    df['agent_type'] = parsed.map(lambda t: t[0])
-    df['os'] = parsed.map(lambda t: t[1])
-    df['os_version'] = parsed.map(lambda t: t[2])
-    df['browser'] = parsed.map(lambda t: t[3])
-    df['browser_version'] = parsed.map(lambda t: t[4])
-    df['device'] = parsed.map(lambda t: t[5])
-    df['is_mobile'] = parsed.map(lambda t: t[6])
-    df['is_tablet'] = parsed.map(lambda t: t[7])
-    df['is_pc'] = parsed.map(lambda t: t[8])
-    df['is_bot'] = parsed.map(lambda t: t[9])
+def _library_fields(o) -> tuple:
+    """Map a parsed user_agents object onto USER_AGENT_COLUMNS."""
+    return (
+        'bot' if o.is_bot else 'human',
+        o.os.family or 'unknown',
+        o.os.version_string or '',
+        o.browser.family or 'unknown',
+        o.browser.version_string or '',
+        o.device.family or 'unknown',
+        int(o.is_mobile),
+        int(o.is_tablet),
+        int(o.is_pc),
+        int(o.is_bot),
+    )
+
+
+def parse_with_heuristics(df: pd.DataFrame, user_agent_column: str = 'user_agent') -> pd.DataFrame:
+    """Parse user agents using simple heuristics when library unavailable.
+
+    The column is made categorical so patterns are matched against distinct
+    strings only; results are broadcast back to rows by category code. The
+    first matching pattern per field (in dict order) wins, as in an if/elif chain.
+    """
+    cat = df[user_agent_column].fillna('').astype(str).astype('category')
+    codes = cat.cat.codes.to_numpy()
+    uniq = pd.Series(cat.cat.categories, dtype=object)
+    empty = (uniq == '').to_numpy()
+    masks = _heuristic_masks(uniq)
+
+    def first_match(field: str) -> np.ndarray:
+        picked = [(value, mask) for (f, value, _), mask in zip(_HEURISTIC_PATTERNS, masks) if f == field]
+        return np.select([m for _, m in picked], [v for v, _ in picked], default='unknown')
+
+    is_bot = masks[0] & ~empty
+    os_name = first_match('os')
+    device = first_match('device')
+    device = np.where((device == 'unknown') & np.isin(os_name, _PC_OSES), 'pc', device)
+
+    df['agent_type'] = np.select([empty, is_bot], ['unknown', 'bot'], default='human')[codes]
+    df['os'] = os_name[codes]
+    df['os_version'] = ''
+    df['browser'] = first_match('browser')[codes]
+    df['browser_version'] = ''
+    df['device'] = device[codes]
+    df['is_mobile'] = (device == 'mobile').astype('int8')[codes]
+    df['is_tablet'] = (device == 'tablet').astype('int8')[codes]
+    df['is_pc'] = (device == 'pc').astype('int8')[codes]
+    df['is_bot'] = is_bot.astype('int8')[codes]
 
     return df
 
 
-def _heuristic_parse(ua: str) -> tuple[str, str, str, str, str, str, int, int, int, int]:
-    """Simple heuristic parsing of user agent string."""
-    if not ua:
-        return ('unknown', 'unknown', '', 'unknown', '', 'unknown', 0, 0, 0, 0)
-
-    u = ua.lower()
-
-    # Detect agent type
-    agent_type = 'bot' if any(x in u for x in ['bot', 'spider', 'crawl']) else 'human'
-
-    # Detect OS
-    if 'windows' in u:
-        os_name = 'windows'
-    elif 'android' in u:
-        os_name = 'android'
-    elif 'linux' in u:
-        os_name = 'linux'
-    elif 'mac os' in u or 'macintosh' in u:
-        os_name = 'mac'
-    else:
-        os_name = 'unknown'
-
-    # Detect browser
-    if 'chrome/' in u:
-        browser = 'chrome'
-    elif 'firefox/' in u:
-        browser = 'firefox'
-    elif 'safari/' in u:
-        browser = 'safari'
-    else:
-        browser = 'unknown'
-
-    # Detect device type
-    if 'mobile' in u:
-        device = 'mobile'
-    elif 'tablet' in u:
-        device = 'tablet'
-    elif os_name in ('windows', 'linux', 'mac'):
-        device = 'pc'
-    else:
-        device = 'unknown'
-
-    # Set flags
-    is_mobile = 1 if device == 'mobile' else 0
-    is_tablet = 1 if device == 'tablet' else 0
-    is_pc = 1 if device == 'pc' else 0
-    is_bot = 1 if agent_type == 'bot' else 0
-
-    return (agent_type, os_name, '', browser, '', device, is_mobile, is_tablet, is_pc, is_bot)
+def _heuristic_masks(ua: pd.Series) -> list[np.ndarray]:
+    """One boolean mask per _HEURISTIC_PATTERNS entry.
+
+    With hyperscan installed each string is scanned once against all
+    patterns; otherwise each pattern is a vectorized str.contains pass.
+    """
+    if hyperscan is None:
+        return [ua.str.contains(p, regex=True).to_numpy(dtype=bool) for _, _, p in _HEURISTIC_PATTERNS]
+
+    db = _hyperscan_db()
+
+    def scan(text: str) -> int:
+        bits = 0
+
+        def on_match(pattern_id, start, end, flags, context):
+            nonlocal bits
+            bits |= 1 << pattern_id
+
+        if text:
+            db.scan(text.encode('utf-8', errors='ignore'), match_event_handler=on_match)
+        return bits
+
+    bits = np.array([scan(u) for u in ua], dtype=np.int64)
+    return [(bits >> i) & 1 == 1 for i in range(len(_HEURISTIC_PATTERNS))]
+
+
+@functools.lru_cache(maxsize=None)
+def _hyperscan_db():
+    """Compile all heuristic patterns into one hyperscan block-mode database."""
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[p.pattern.encode() for _, _, p in _HEURISTIC_PATTERNS],
+        ids=list(range(len(_HEURISTIC_PATTERNS))),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(_HEURISTIC_PATTERNS),
+    )
+    return db
 
 
 def add_empty_user_agent_columns(df: pd.DataFrame) -> pd.DataFrame:
     """Add empty user agent columns to dataframe for schema consistency."""
-    for col in USER_AGENT_COLUMNS:
-        if col.startswith('is_'):
-            df[col] = None  # Will be cast to INTEGER in SQL
-        else:
-            df[col] = None  # Will be cast to VARCHAR in SQL
+    # All-NULL object columns; SQL casts them (INTEGER for is_*, VARCHAR otherwise)
+    df[USER_AGENT_COLUMNS] = None
     return df
 
 
 def create_empty_user_agent_view_sql() -> str:
     """Generate SQL for creating empty user agent view with proper schema."""
     from .sql_loader import load_view_sql
-    return load_view_sql('silver_page_count_empty')
\ No newline at end of file
+    return load_view_sql('silver_page_count_empty')
+
+
+def create_heuristic_user_agent_view_sql(page_columns: str = 'p.*', dt_expr: str = 'CAST(NULL AS DATE)') -> str:
+    """Generate SQL for a silver_page_count view with heuristic user agent columns.
+
+    Same rules as parse_with_heuristics, evaluated by DuckDB without a pandas round trip.
+    """
+    from .sql_loader import load_view_sql
+    return load_view_sql('silver_page_count_heuristic', page_columns=page_columns, dt_expr=dt_expr)
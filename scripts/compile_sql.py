@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Pre-compile sql/reports/*.sql into ducklake_core/_compiled_reports.py.
+
+Each report is cleaned with the same loader the pipeline uses at runtime, so
+load_sql_reports() can return the frozen dict without touching the files.
+The generated module records each file's mtime; the pipeline falls back to
+reading sql/reports/ whenever those no longer match.
+
+Usage: python scripts/compile_sql.py
+"""
+import os
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from ducklake_core.simple_pipeline import SQL_REPORTS_DIR  # noqa: E402
+from ducklake_core.sql_loader import load_sql_file  # noqa: E402
+
+OUTPUT = ROOT / 'ducklake_core' / '_compiled_reports.py'
+
+
+def compile_reports() -> tuple[dict[str, str], tuple[tuple[str, int], ...]]:
+    reports = {}
+    sources = []
+    if not SQL_REPORTS_DIR.exists():
+        return reports, tuple(sources)
+    with os.scandir(SQL_REPORTS_DIR) as it:
+        entries = sorted((e for e in it if e.name.endswith('.sql') and e.is_file()), key=lambda e: e.name)
+    for entry in entries:
+        sources.append((entry.name, entry.stat().st_mtime_ns))
+        sql = load_sql_file(pathlib.Path(entry.path))
+        if sql:
+            reports[entry.name[:-4]] = sql
+    return reports, tuple(sources)
+
+
+def render(reports: dict[str, str], sources: tuple[tuple[str, int], ...]) -> str:
+    lines = [
+        '"""Generated by scripts/compile_sql.py -- do not edit."""',
+        'from types import MappingProxyType',
+        '',
+        f'SOURCES = {sources!r}',
+        '',
+        'REPORTS = MappingProxyType({',
+    ]
+    lines += [f'    {name!r}: {sql!r},' for name, sql in reports.items()]
+    lines.append('})')
+    return '\n'.join(lines) + '\n'
+
+
+def main() -> int:
+    reports, sources = compile_reports()
+    OUTPUT.write_text(render(reports, sources))
+    print(f"Wrote {len(reports)} report(s) to {OUTPUT.relative_to(ROOT)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
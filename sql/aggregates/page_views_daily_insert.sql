@@ -1,9 +1,10 @@
 -- Insert new page view aggregates from lake_page_count
 -- Uses dynamic timestamp column detection via {coalesce_expr} parameter
+-- Only days after the current max(dt) are aggregated; the watermark is read in the same statement
 INSERT OR REPLACE INTO page_views_daily
 SELECT date({coalesce_expr}) AS dt,
        count(*) AS views,
        count(DISTINCT ip) AS uniq_ips
 FROM lake_page_count
-WHERE {coalesce_expr} IS NOT NULL AND date({coalesce_expr}) > ?
+WHERE {coalesce_expr} IS NOT NULL AND date({coalesce_expr}) > (SELECT COALESCE(max(dt), DATE '1970-01-01') FROM page_views_daily)
 GROUP BY 1;
\ No newline at end of file
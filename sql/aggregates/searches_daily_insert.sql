@@ -1,6 +1,7 @@
 -- Insert new search aggregates from lake_search_logs
 -- Uses dynamic timestamp column via {time_col} parameter
 -- Includes quality filters for query normalization
+-- Only days after the current max(dt) are aggregated; the watermark is read in the same statement
 INSERT OR REPLACE INTO searches_daily
 SELECT date({time_col}) AS dt,
        lower(trim(regexp_replace(query, '\s+', ' '))) AS query,
@@ -11,5 +12,5 @@ WHERE {time_col} IS NOT NULL
   AND length(trim(query)) > 0
   AND lower(trim(query)) <> 'null'
   AND length(lower(trim(regexp_replace(query, '\s+', ' ')))) > 1
-  AND date({time_col}) > ?
+  AND date({time_col}) > (SELECT COALESCE(max(dt), DATE '1970-01-01') FROM searches_daily)
 GROUP BY 1, 2;
\ No newline at end of file
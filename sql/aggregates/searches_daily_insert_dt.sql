@@ -1,12 +1,13 @@
 -- Insert new search aggregates from lake_search_logs using dt column
 -- Fallback when no timestamp columns are available
 -- Includes quality filters for query normalization
+-- Only days after the current max(dt) are aggregated; the watermark is read in the same statement
 INSERT OR REPLACE INTO searches_daily
 SELECT dt,
        lower(trim(regexp_replace(query, '\s+', ' '))) AS query,
        count(*) AS cnt
 FROM lake_search_logs
-WHERE dt > ?
+WHERE dt > (SELECT COALESCE(max(dt), DATE '1970-01-01') FROM searches_daily)
   AND query IS NOT NULL
   AND length(trim(query)) > 0
   AND lower(trim(query)) <> 'null'
@@ -0,0 +1,17 @@
+-- Parse structured search log lines in one vectorized pass
+-- Line format: INFO:root:<timestamp> - IP: <ip> - Query: <query>
+-- The file path is bound as the single ? parameter (callers must not pass glob characters).
+-- Lines are read one VARCHAR per row (NUL delimiter, no quoting), so file size is not
+-- bound by the string limit. Fields are returned unstripped; the caller applies
+-- str.strip() so Unicode whitespace is handled exactly as in the Python line parser.
+SELECT m.ts AS timestamp, m.ip AS ip, m.query AS query
+FROM (
+    SELECT regexp_extract(line, '^INFO:root:(.*?) - IP:(.*?) - Query:(.*)$', ['ts', 'ip', 'query']) AS m
+    FROM (
+        -- Same ASCII whitespace bytes.strip() removes from each raw line
+        SELECT trim(line, ' ' || chr(9) || chr(10) || chr(11) || chr(12) || chr(13)) AS line
+        FROM read_csv(?, columns = {'line': 'VARCHAR'}, delim = '\0', quote = '', escape = '',
+                      header = false, auto_detect = false, strict_mode = false)
+    )
+    WHERE regexp_matches(line, '^INFO:root:.*? - IP:.*? - Query:')
+);
@@ -0,0 +1,18 @@
+-- Materialize silver_page_count by joining lake_page_count to the user agent lookup
+-- silver_user_agents holds one parsed row per distinct user_agent string
+-- {page_columns}: lake columns to keep, {dt_expr}: expression deriving dt
+CREATE OR REPLACE TABLE silver_page_count AS
+SELECT {page_columns},
+       u.agent_type,
+       u.os,
+       u.os_version,
+       u.browser,
+       u.browser_version,
+       u.device,
+       u.is_mobile,
+       u.is_tablet,
+       u.is_pc,
+       u.is_bot,
+       {dt_expr} AS dt
+FROM lake_page_count p
+LEFT JOIN silver_user_agents u ON p.user_agent IS NOT DISTINCT FROM u.user_agent;
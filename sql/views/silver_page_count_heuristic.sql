@@ -0,0 +1,36 @@
+-- Create silver_page_count with heuristic user agent columns computed in DuckDB
+-- Mirrors user_agent_enricher.parse_with_heuristics; used when the user_agents library is unavailable
+-- {page_columns}: lake columns to keep, {dt_expr}: expression deriving dt
+CREATE OR REPLACE VIEW silver_page_count AS
+SELECT h.* EXCLUDE (dt),
+       CAST(h.device = 'mobile' AS INTEGER) AS is_mobile,
+       CAST(h.device = 'tablet' AS INTEGER) AS is_tablet,
+       CAST(h.device = 'pc' AS INTEGER) AS is_pc,
+       CAST(h.agent_type = 'bot' AS INTEGER) AS is_bot,
+       h.dt
+FROM (
+  SELECT {page_columns},
+         CASE WHEN COALESCE(p.user_agent, '') = '' THEN 'unknown'
+              WHEN regexp_matches(p.user_agent, 'bot|spider|crawl', 'i') THEN 'bot'
+              ELSE 'human' END AS agent_type,
+         CASE WHEN regexp_matches(p.user_agent, 'windows', 'i') THEN 'windows'
+              WHEN regexp_matches(p.user_agent, 'android', 'i') THEN 'android'
+              WHEN regexp_matches(p.user_agent, 'linux', 'i') THEN 'linux'
+              WHEN regexp_matches(p.user_agent, 'mac os|macintosh', 'i') THEN 'mac'
+              ELSE 'unknown' END AS os,
+         '' AS os_version,
+         CASE WHEN regexp_matches(p.user_agent, 'chrome/', 'i') THEN 'chrome'
+              WHEN regexp_matches(p.user_agent, 'firefox/', 'i') THEN 'firefox'
+              WHEN regexp_matches(p.user_agent, 'safari/', 'i') THEN 'safari'
+              ELSE 'unknown' END AS browser,
+         '' AS browser_version,
+         -- Without a mobile/tablet marker, desktop operating systems imply a pc (android wins over linux)
+         CASE WHEN regexp_matches(p.user_agent, 'mobile', 'i') THEN 'mobile'
+              WHEN regexp_matches(p.user_agent, 'tablet', 'i') THEN 'tablet'
+              WHEN regexp_matches(p.user_agent, 'windows', 'i') THEN 'pc'
+              WHEN regexp_matches(p.user_agent, 'android', 'i') THEN 'unknown'
+              WHEN regexp_matches(p.user_agent, 'linux|mac os|macintosh', 'i') THEN 'pc'
+              ELSE 'unknown' END AS device,
+         {dt_expr} AS dt
+  FROM lake_page_count p
+) h;
@@ -1,7 +1,29 @@
+import os
 import sys
-from pathlib import Path
 
-# Add project root to sys.path for local package imports
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+import pytest
+
+# Fall back to the project root on sys.path only when the package is not installed
+try:
+    import ducklake_core  # noqa: F401
+except ImportError:
+    ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+
+
+def _bulk_insert(conn, table, rows):
+    """Insert all rows with one multi-row VALUES statement."""
+    rows = list(rows)
+    if not rows:
+        return
+    row_placeholder = f"({', '.join('?' * len(rows[0]))})"
+    placeholders = ', '.join([row_placeholder] * len(rows))
+    params = [value for row in rows for value in row]
+    conn.execute(f"INSERT INTO {table} VALUES {placeholders}", params)
+
+
+@pytest.fixture
+def bulk_insert():
+    """Helper for tests that need many rows; avoids slow executemany."""
+    return _bulk_insert
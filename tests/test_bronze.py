@@ -3,10 +3,19 @@ import tempfile
 import pathlib
 
 import duckdb
+import pytest
 
 from ducklake_core.bronze import ingest_bronze, backfill_manifest_from_bronze
 
 
+def _write(path, data):
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+    try:
+        os.write(fd, data.encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
 def setup_temp(conn, root):
     conn.execute(
         """
@@ -25,14 +34,43 @@ def setup_temp(conn, root):
     )
 
 
-def test_ingest_and_backfill_jsonl(tmp_path):
-    db = duckdb.connect(str(tmp_path / "test.duckdb"))
-    setup_temp(db, tmp_path)
-    lake = tmp_path
+@pytest.fixture(scope="module")
+def shared_db():
+    """One in-memory connection with the manifest table, shared by the module."""
+    conn = duckdb.connect(":memory:", config={"threads": "1", "memory_limit": "256MB"})
+    setup_temp(conn, None)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def db(shared_db):
+    """Run each test inside a transaction that is rolled back afterwards."""
+    shared_db.begin()
+    try:
+        yield shared_db
+    finally:
+        shared_db.rollback()
+
 
+@pytest.fixture(scope="session")
+def bronze_root(tmp_path_factory):
+    """Single base directory shared by all bronze tests."""
+    return tmp_path_factory.mktemp("bronze")
+
+
+@pytest.fixture
+def lake(bronze_root, request):
+    """Per-test lake directory under the shared bronze root."""
+    path = bronze_root / request.node.name
+    path.mkdir()
+    return path
+
+
+def test_ingest_and_backfill_jsonl(db, lake):
     # Create a tiny jsonl file
-    raw = tmp_path / "data.jsonl"
-    raw.write_text('{"a":1}\n{"a":2}\n', encoding="utf-8")
+    raw = lake / "data.jsonl"
+    _write(raw, '{"a":1}\n{"a":2}\n')
 
     dest, status = ingest_bronze(db, lake, "unit", str(raw), "json")
     assert status in ("INGESTED", "SKIPPED_DUPLICATE")
@@ -44,20 +82,16 @@ def test_ingest_and_backfill_jsonl(tmp_path):
     bronze_dir = lake / "bronze" / "source=unit" / "format=json" / "dt=2025-01-01" / "run=TEST"
     bronze_dir.mkdir(parents=True, exist_ok=True)
     orphan = bronze_dir / "orphan.jsonl"
-    orphan.write_text('{"a":3}\n', encoding="utf-8")
+    _write(orphan, '{"a":3}\n')
 
     backfill_manifest_from_bronze(db, lake, "unit")
     rows2 = db.execute("SELECT COUNT(*) FROM manifest WHERE source='unit'").fetchone()[0]
     assert rows2 >= 2
 
 
-def test_ingest_csv(tmp_path):
-    db = duckdb.connect(str(tmp_path / "test.duckdb"))
-    setup_temp(db, tmp_path)
-    lake = tmp_path
-
-    csv_path = tmp_path / "t.csv"
-    csv_path.write_text("a,b\n1,2\n3,4\n", encoding="utf-8")
+def test_ingest_csv(db, lake):
+    csv_path = lake / "t.csv"
+    _write(csv_path, "a,b\n1,2\n3,4\n")
 
     dest, status = ingest_bronze(db, lake, "csvsrc", str(csv_path), "csv")
     assert pathlib.Path(dest).exists()
@@ -12,9 +12,9 @@ from ducklake_core.exceptions import DatabaseOperationError
 
 
 @pytest.fixture
-def test_conn():
+def test_conn(bulk_insert):
     """Create test database connection."""
-    conn = duckdb.connect(':memory:')
+    conn = duckdb.connect(':memory:', config={'threads': '1', 'memory_limit': '256MB'})
 
     # Create test table
     conn.execute("""
@@ -28,11 +28,11 @@ def test_conn():
     """)
 
     # Insert test data
-    conn.execute("""
-        INSERT INTO test_table VALUES
+    # NOTE: do not use executemany here - see DuckDB #10106
+    bulk_insert(conn, 'test_table', [
         (1, 'test1', '2023-01-01 10:00:00', '2023-01-01 10:00:00', '2023-01-01'),
-        (2, 'test2', '2023-01-02 11:00:00', '2023-01-02 11:00:00', '2023-01-02')
-    """)
+        (2, 'test2', '2023-01-02 11:00:00', '2023-01-02 11:00:00', '2023-01-02'),
+    ])
 
     return conn
 
@@ -97,45 +97,16 @@ class TestDatabaseUtils:
         result = find_timestamp_column(test_conn, 'nonexistent_table')
         assert result is None
 
-    def test_create_coalesce_expression_found(self):
-        """Test creating COALESCE expression when columns are found."""
-        columns = ['id', 'timestamp', 'event_ts', 'name']
-        candidates = ['timestamp', 'event_ts', 'time']
-
-        result = create_coalesce_expression(columns, candidates)
-        assert result == 'COALESCE(timestamp, event_ts)'
-
-    def test_create_coalesce_expression_partial_match(self):
-        """Test creating COALESCE expression with partial matches."""
-        columns = ['id', 'event_ts', 'name']
-        candidates = ['timestamp', 'event_ts', 'time']
-
-        result = create_coalesce_expression(columns, candidates)
-        assert result == 'COALESCE(event_ts)'
-
-    def test_create_coalesce_expression_no_match(self):
-        """Test creating COALESCE expression when no columns match."""
-        columns = ['id', 'name', 'other']
-        candidates = ['timestamp', 'event_ts', 'time']
-
-        result = create_coalesce_expression(columns, candidates)
-        assert result is None
-
-    def test_create_coalesce_expression_empty_columns(self):
-        """Test creating COALESCE expression with empty columns."""
-        columns = []
-        candidates = ['timestamp', 'event_ts']
-
-        result = create_coalesce_expression(columns, candidates)
-        assert result is None
-
-    def test_create_coalesce_expression_empty_candidates(self):
-        """Test creating COALESCE expression with empty candidates."""
-        columns = ['timestamp', 'id']
-        candidates = []
-
-        result = create_coalesce_expression(columns, candidates)
-        assert result is None
+    @pytest.mark.parametrize("columns,candidates,expected", [
+        (['id', 'timestamp', 'event_ts', 'name'], ['timestamp', 'event_ts', 'time'], 'COALESCE(timestamp, event_ts)'),
+        (['id', 'event_ts', 'name'], ['timestamp', 'event_ts', 'time'], 'COALESCE(event_ts)'),
+        (['id', 'name', 'other'], ['timestamp', 'event_ts', 'time'], None),
+        ([], ['timestamp', 'event_ts'], None),
+        (['timestamp', 'id'], [], None),
+    ], ids=['found', 'partial_match', 'no_match', 'empty_columns', 'empty_candidates'])
+    def test_create_coalesce_expression(self, columns, candidates, expected):
+        """Test creating COALESCE expression from the available candidate columns."""
+        assert create_coalesce_expression(columns, candidates) == expected
 
 
 class TestDatabaseUtilsIntegration:
@@ -1,9 +1,17 @@
 """Tests for pipeline timing utilities."""
 import pytest
-import time
+from ducklake_core import pipeline_timer
 from ducklake_core.pipeline_timer import PipelineTimer
 
 
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the timer's clock with one advanced by hand (in seconds)."""
+    now = [1000.0]
+    monkeypatch.setattr(pipeline_timer.time, "perf_counter_ns", lambda: round(now[0] * 1e9))
+    return now
+
+
 class TestPipelineTimer:
     """Test pipeline timing functionality."""
 
@@ -14,61 +22,70 @@ class TestPipelineTimer:
         assert len(timer.phases) == 0
         assert timer.start_time > 0
 
-    def test_phase_context_manager(self):
+    def test_public_attributes(self, clock):
+        """Test start_time is wall-clock epoch seconds and phases is the live dict."""
+        before = pipeline_timer.time.time()
+        timer = PipelineTimer()
+        assert before <= timer.start_time <= pipeline_timer.time.time()
+
+        timer.phases['manual_s'] = 1.5
+        assert timer.get_summary()['manual_s'] == 1.5
+
+    def test_phase_context_manager(self, clock):
         """Test using phase as context manager."""
         timer = PipelineTimer()
 
         with timer.phase('test_phase'):
-            time.sleep(0.01)  # Small delay to measure
+            clock[0] += 0.01
 
         # Should have recorded the phase
         assert 'test_phase_s' in timer.phases
         assert timer.phases['test_phase_s'] > 0
         assert timer.phases['test_phase_s'] < 1  # Should be small
 
-    def test_multiple_phases(self):
+    def test_multiple_phases(self, clock):
         """Test timing multiple phases."""
         timer = PipelineTimer()
 
         with timer.phase('phase1'):
-            time.sleep(0.01)
+            clock[0] += 0.01
 
         with timer.phase('phase2'):
-            time.sleep(0.01)
+            clock[0] += 0.01
 
         # Should have both phases
         assert 'phase1_s' in timer.phases
         assert 'phase2_s' in timer.phases
         assert len(timer.phases) == 2
 
-    def test_phase_with_exception(self):
+    def test_phase_with_exception(self, clock):
         """Test that timing works even when phase raises exception."""
         timer = PipelineTimer()
 
         with pytest.raises(ValueError):
             with timer.phase('error_phase'):
-                time.sleep(0.01)
+                clock[0] += 0.01
                 raise ValueError("Test error")
 
         # Should still record timing
         assert 'error_phase_s' in timer.phases
         assert timer.phases['error_phase_s'] > 0
 
-    def test_get_total_time(self):
+    def test_get_total_time(self, clock):
         """Test getting total elapsed time."""
         timer = PipelineTimer()
-        time.sleep(0.01)
+        clock[0] += 0.01
 
         total = timer.get_total_time()
         assert total > 0
         assert total < 1  # Should be small
 
-    def test_get_summary(self):
+    def test_get_summary(self, clock):
         """Test getting timing summary."""
         timer = PipelineTimer()
 
         with timer.phase('test'):
-            time.sleep(0.01)
+            clock[0] += 0.01
 
         summary = timer.get_summary()
 
@@ -89,14 +106,14 @@ class TestPipelineTimer:
         # Should be 0 or very small number
         assert timer.phases['quick_s'] >= 0
 
-    def test_nested_phases_not_supported(self):
+    def test_nested_phases_not_supported(self, clock):
         """Test that nested phases work independently."""
         timer = PipelineTimer()
 
         with timer.phase('outer'):
-            time.sleep(0.01)
+            clock[0] += 0.01
             with timer.phase('inner'):
-                time.sleep(0.01)
+                clock[0] += 0.01
 
         # Both phases should be recorded
         assert 'outer_s' in timer.phases
@@ -118,20 +135,20 @@ class TestPipelineTimer:
         assert 'my_phase_s' in timer.phases
         assert 'another-phase_s' in timer.phases
 
-    def test_timer_reuse(self):
+    def test_timer_reuse(self, clock):
         """Test that timer can be reused for multiple measurements."""
         timer = PipelineTimer()
 
         # First measurement
         with timer.phase('first'):
-            time.sleep(0.01)
+            clock[0] += 0.01
 
         first_total = timer.get_total_time()
 
         # Second measurement
-        time.sleep(0.01)
+        clock[0] += 0.01
         with timer.phase('second'):
-            time.sleep(0.01)
+            clock[0] += 0.01
 
         second_total = timer.get_total_time()
 
@@ -140,18 +157,18 @@ class TestPipelineTimer:
         assert 'first_s' in timer.phases
         assert 'second_s' in timer.phases
 
-    def test_summary_immutability(self):
+    def test_summary_immutability(self, clock):
         """Test that summary is a snapshot, not a reference."""
         timer = PipelineTimer()
 
         with timer.phase('test'):
-            time.sleep(0.01)
+            clock[0] += 0.01
 
         summary1 = timer.get_summary()
 
         # Add another phase
         with timer.phase('test2'):
-            time.sleep(0.01)
+            clock[0] += 0.01
 
         summary2 = timer.get_summary()
 
@@ -164,19 +181,19 @@ class TestPipelineTimer:
 class TestPipelineTimerIntegration:
     """Integration tests for pipeline timer."""
 
-    def test_realistic_pipeline_timing(self):
+    def test_realistic_pipeline_timing(self, clock):
         """Test timing a realistic pipeline scenario."""
         timer = PipelineTimer()
 
         # Simulate pipeline phases
         with timer.phase('ingest'):
-            time.sleep(0.02)
+            clock[0] += 0.02
 
         with timer.phase('transform'):
-            time.sleep(0.03)
+            clock[0] += 0.03
 
         with timer.phase('load'):
-            time.sleep(0.01)
+            clock[0] += 0.01
 
         summary = timer.get_summary()
 
@@ -191,25 +208,25 @@ class TestPipelineTimerIntegration:
         assert summary['transform_s'] > summary['ingest_s']  # Transform took longer
         assert summary['ingest_s'] > summary['load_s']       # Ingest took longer than load
 
-    def test_error_recovery_timing(self):
+    def test_error_recovery_timing(self, clock):
         """Test timing when some phases fail."""
         timer = PipelineTimer()
 
         # Successful phase
         with timer.phase('setup'):
-            time.sleep(0.01)
+            clock[0] += 0.01
 
         # Failed phase
         try:
             with timer.phase('process'):
-                time.sleep(0.01)
+                clock[0] += 0.01
                 raise RuntimeError("Processing failed")
         except RuntimeError:
             pass
 
         # Recovery phase
         with timer.phase('cleanup'):
-            time.sleep(0.01)
+            clock[0] += 0.01
 
         summary = timer.get_summary()
 
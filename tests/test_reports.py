@@ -1,13 +1,17 @@
 import csv
-import os
+import functools
+from types import MappingProxyType
 from datetime import date, timedelta
+from pathlib import Path
 import pytest
 
-REPORTS_DIR = os.path.join(os.path.dirname(__file__), '..', 'reports')
+REPORTS_DIR = Path(__file__).resolve().parent.parent / 'reports'
 
+@functools.lru_cache(maxsize=None)
 def read_csv_rows(filename):
-    with open(os.path.join(REPORTS_DIR, filename), newline='') as f:
-        return list(csv.DictReader(f))
+    # Cached per file and shared by every caller, so rows are read-only mappings
+    with open(REPORTS_DIR / filename, newline='') as f:
+        return tuple(MappingProxyType(row) for row in csv.DictReader(f))
 
 def test_busiest_days_of_week():
     rows = read_csv_rows('busiest_days_of_week.csv')
@@ -11,6 +11,7 @@ from ducklake_core.search_log_parser import (
     parse_csv_line,
     parse_plain_text_line,
     parse_search_logs_file,
+    parse_search_logs_file_arrow,
     get_parse_statistics
 )
 from ducklake_core.config import LogFormat
@@ -56,6 +57,15 @@ INFO:root:2023-01-01T10:01:00Z - IP: 192.168.1.2 - Query: another query'''
 
         assert result == LogFormat.CSV
 
+    def test_detect_log_format_redetects_after_change(self, tmp_path):
+        """Test the cached detection is invalidated when the file changes."""
+        log_file = tmp_path / 'search.log'
+        log_file.write_text('{"q": "a"}\n{"q": "b"}\n')
+        assert detect_log_format(log_file) == LogFormat.JSON_LINES
+
+        log_file.write_text('just some words\n')
+        assert detect_log_format(log_file) == LogFormat.PLAIN_TEXT
+
     def test_detect_plain_text_format(self):
         """Test detection of plain text format as fallback."""
         content = '''Some random log content without clear structure
@@ -159,6 +169,25 @@ class TestStructuredLogParsing:
         result = parse_structured_log_line(line)
         assert result is None
 
+    @pytest.mark.parametrize('name', ['search.log', 'search[1]*?.log'])
+    def test_parse_structured_log_file_matches_line_parser(self, tmp_path, name):
+        """Test the DuckDB file parser against the Python line parser, incl. Unicode whitespace."""
+        from ducklake_core.search_log_parser import _parse_lines, iter_file_lines, parse_structured_log_file
+
+        log_file = tmp_path / name
+        log_file.write_bytes(
+            'INFO:root:2023-01-01T10:00:00Z - IP: 1.1.1.1 - Query: say "hi", ok\r\n'
+            '\n'
+            '  INFO:root:2023-01-01T10:01:00Z  - IP:  2.2.2.2 - Query: café　\n'
+            '\x0bINFO:root:2023-01-01 - IP: 3.3.3.3 - Query:  \n'
+            'INFO:root:2023-01-01T10:02:00Z - Query: x - IP: 4.4.4.4\n'
+            'INFO:root:2023-01-01 10:03:00 - IP: 5.5.5.5 - Query: a - IP: b\n'.encode('utf-8')
+        )
+
+        expected = _parse_lines(iter_file_lines(log_file), LogFormat.STRUCTURED_LOG, True)
+        assert [r['query'] for r in expected] == ['say "hi", ok', 'café', 'a - IP: b']
+        assert parse_structured_log_file(log_file) == expected
+
 
 class TestJSONLineParsing:
     """Test parsing of JSON line format."""
@@ -215,6 +244,20 @@ class TestCSVLineParsing:
         assert result is not None
         assert result['query'] == 'test+query'
 
+    def test_parse_csv_file_quoted_fields(self, tmp_path):
+        """Test whole-file CSV parsing keeps commas inside quoted fields."""
+        log_file = tmp_path / 'search.csv'
+        log_file.write_text(
+            '2023-01-01 10:00:00,"red, green",192.168.1.1\n'
+            '2023-01-01 10:01:00,q=blue,192.168.1.2\n'
+            'not-a-date,ignored\n'
+        )
+
+        records = parse_search_logs_file(log_file)
+
+        assert [r['query'] for r in records] == ['red, green', 'blue']
+        assert records[0]['timestamp'] == '2023-01-01T10:00:00Z'
+
     def test_parse_csv_line_invalid_timestamp(self):
         """Test parsing CSV line with invalid timestamp."""
         line = 'not-a-timestamp,query,ip'
@@ -283,6 +326,67 @@ Some invalid line'''
         assert results[0]['query'] == 'first query'
         assert results[0]['ip'] == '192.168.1.1'
 
+    def test_parse_search_logs_file_parallel_matches_sequential(self, tmp_path, monkeypatch):
+        """Test that byte-range parallel parsing returns the same records in order."""
+        from ducklake_core import search_log_parser
+
+        lines = [f'{{"timestamp": "2023-01-01T10:{i % 60:02d}:00Z", "query": "query {i}"}}' for i in range(500)]
+        log_file = tmp_path / 'search.log'
+        log_file.write_text('\n'.join(lines) + '\n')
+
+        sequential = parse_search_logs_file(log_file)
+        monkeypatch.setattr(search_log_parser, 'PARALLEL_MIN_BYTES', 0)
+        assert parse_search_logs_file(log_file) == sequential  # sequential unless workers is passed
+        parallel = parse_search_logs_file(log_file, workers=4)
+
+        assert len(parallel) == 500
+        assert parallel == sequential
+
+    def test_parse_search_logs_file_parallel_falls_back_when_pool_breaks(self, tmp_path, monkeypatch):
+        """Test that a broken worker pool falls back to in-process parsing."""
+        from concurrent.futures.process import BrokenProcessPool
+        from ducklake_core import search_log_parser
+
+        log_file = tmp_path / 'search.log'
+        log_file.write_text('{"timestamp": "2023-01-01T10:00:00Z", "query": "q"}\n' * 3)
+
+        def broken(*args, **kwargs):
+            raise BrokenProcessPool('worker failed to start')
+
+        monkeypatch.setattr(search_log_parser, 'PARALLEL_MIN_BYTES', 0)
+        monkeypatch.setattr(search_log_parser, '_parse_file_parallel', broken)
+
+        assert len(parse_search_logs_file(log_file, workers=4)) == 3
+
+    def test_parse_search_logs_file_arrow(self, tmp_path):
+        """Test parsing into a columnar RecordBatch."""
+        log_file = tmp_path / 'search.log'
+        log_file.write_text('''INFO:root:2023-01-01T10:00:00Z - IP: 192.168.1.1 - Query: first query
+INFO:root:2023-01-01T10:01:00Z - IP: 192.168.1.2 - Query: second query
+Some invalid line''')
+
+        batch = parse_search_logs_file_arrow(log_file)
+
+        assert batch.schema.names == ['timestamp', 'ip', 'query']
+        assert batch.num_rows == 2
+        assert batch.column('query').to_pylist() == ['first query', 'second query']
+        assert get_parse_statistics(log_file, batch)['rows'] == 2
+
+    def test_parse_search_logs_file_arrow_matches_records(self, tmp_path, monkeypatch):
+        """Test that the columnar path (in-process and parallel) matches the record path."""
+        import ducklake_core.search_log_parser as slp
+
+        log_file = tmp_path / 'search.jsonl'
+        log_file.write_text('\n'.join(
+            f'{{"timestamp": "2023-01-01T10:{i % 60:02d}:00Z", "ip": "10.0.0.{i % 7}", "query": "q{i}"}}'
+            for i in range(50)
+        ))
+        expected = [[r.get(name) for r in parse_search_logs_file(log_file)] for name in slp.SEARCH_LOG_COLUMNS]
+
+        assert parse_search_logs_file_arrow(log_file).to_pydict() == dict(zip(slp.SEARCH_LOG_COLUMNS, expected))
+        monkeypatch.setattr(slp, 'PARALLEL_MIN_BYTES', 0)
+        assert parse_search_logs_file_arrow(log_file, workers=2).to_pydict() == dict(zip(slp.SEARCH_LOG_COLUMNS, expected))
+
     def test_parse_search_logs_file_nonexistent(self):
         """Test parsing nonexistent file."""
         with pytest.raises(FileNotFoundError):
@@ -1,15 +1,34 @@
 import duckdb
-import pathlib
+import pytest
+import ducklake_core.anomaly as anomaly
+import ducklake_core.simple_pipeline as sp
 from ducklake_core.simple_pipeline import simple_refresh
 
-DB_PATH = 'contentlake.ducklake'
-
 EXPECTED_COLS = {
     'url','ip','user_agent','timestamp','dt','agent_type','os','os_version','browser','browser_version','device','is_mobile','is_tablet','is_pc','is_bot'
 }
 
-def test_silver_page_count_enrichment():
-    conn = duckdb.connect(DB_PATH)
+
+@pytest.fixture
+def pipeline_dirs(tmp_path, monkeypatch):
+    """Point every pipeline input/output directory into tmp_path (safe under xdist, leaves the repo untouched)."""
+    dirs = {name: tmp_path / name for name in ('raw', 'lake', 'reports')}
+    monkeypatch.setattr(sp, 'RAW_DIR', dirs['raw'])
+    monkeypatch.setattr(sp, 'LAKE_DIR', dirs['lake'])
+    monkeypatch.setattr(sp, 'REPORTS_DIR', dirs['reports'])
+    monkeypatch.setattr(anomaly, 'REPORTS_DIR', dirs['reports'])
+    return dirs
+
+
+def test_silver_page_count_enrichment(pipeline_dirs, tmp_path):
+    day = pipeline_dirs['raw'] / 'page_count' / 'dt=2025-09-25'
+    day.mkdir(parents=True)
+    (day / 'part.csv').write_text(
+        'url,ip,user_agent,timestamp\n'
+        '/home,1.1.1.1,Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0,2025-09-25T10:00:00\n'
+        '/about,2.2.2.2,Googlebot/2.1 (+http://www.google.com/bot.html),2025-09-25T11:00:00\n'
+    )
+    conn = duckdb.connect(str(tmp_path / 'contentlake.ducklake'))
     res = simple_refresh(conn)
     cols = [r[0] for r in conn.execute('DESCRIBE silver_page_count').fetchall()]
     missing = EXPECTED_COLS - set(cols)
@@ -17,3 +36,33 @@ def test_silver_page_count_enrichment():
     sample = conn.execute('SELECT agent_type, os, device FROM silver_page_count LIMIT 5').fetchall()
     assert len(sample) <= 5
     assert 'latest_page_dt' in res and res['latest_page_dt'] is not None
+    conn.close()
+
+
+def test_ingest_records_each_file_before_the_next(pipeline_dirs, tmp_path, monkeypatch):
+    day = pipeline_dirs['raw'] / 'page_count' / 'dt=2025-09-25'
+    day.mkdir(parents=True)
+    for name in ('a.csv', 'b.csv'):
+        (day / name).write_text(f'url,ip\n/{name},1.1.1.1\n')
+
+    # Check what a SIGKILL during the second file would leave behind, then stop there
+    real_ingest = sp._ingest_file
+    recorded_before = []
+
+    def ingest_then_die(conn, *args):
+        recorded_before.append(conn.execute('SELECT count(*) FROM processed_files').fetchone()[0])
+        if len(recorded_before) == 2:
+            raise KeyboardInterrupt
+        return real_ingest(conn, *args)
+
+    monkeypatch.setattr(sp, '_ingest_file', ingest_then_die)
+    conn = duckdb.connect(':memory:')
+    sp.ensure_core_tables(conn)
+    with pytest.raises(KeyboardInterrupt):
+        sp.ingest_new_files(conn)
+
+    assert recorded_before == [0, 1]
+    monkeypatch.setattr(sp, '_ingest_file', real_ingest)
+    assert sp.ingest_new_files(conn) == 1
+    lake_rows = conn.execute(f"SELECT count(*) FROM read_parquet('{tmp_path}/lake/page_count/*.parquet')").fetchone()[0]
+    assert lake_rows == 2
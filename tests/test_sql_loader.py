@@ -3,11 +3,13 @@ import pytest
 import tempfile
 import pathlib
 from ducklake_core.sql_loader import (
+    clean_sql,
     load_sql_file,
     load_schema_sql,
     get_sql_path,
     load_aggregate_sql,
     load_view_sql,
+    load_table_sql,
     load_schema_sql_file
 )
 from ducklake_core.exceptions import DatabaseOperationError
@@ -34,11 +36,7 @@ SELECT * FROM test_table;"""
         """Test loading SQL file with parameter substitution."""
         sql_content = """SELECT * FROM {table_name} WHERE id = {user_id}"""
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False) as f:
-            f.write(sql_content)
-            f.flush()
-
-            result = load_sql_file(pathlib.Path(f.name), table_name='users', user_id=123)
+        result = clean_sql(sql_content, table_name='users', user_id=123)
 
         assert result == 'SELECT * FROM users WHERE id = 123'
 
@@ -50,29 +48,39 @@ SELECT id,
 name FROM table
 -- Final comment"""
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False) as f:
-            f.write(sql_content)
-            f.flush()
-
-            result = load_sql_file(pathlib.Path(f.name))
+        result = clean_sql(sql_content)
 
         expected = """SELECT id,
 
 name FROM table"""
         assert result == expected
 
+    def test_load_sql_file_inline_comments_outside_quotes(self, tmp_path):
+        """Test that inline comments are removed but -- inside strings is kept."""
+        sql_file = tmp_path / 'inline.sql'
+        sql_file.write_text("SELECT '--not a comment' AS a, -- trailing\n  \"x--y\" AS b;")
+
+        result = load_sql_file(sql_file)
+
+        assert result == "SELECT '--not a comment' AS a,\n  \"x--y\" AS b"
+
     def test_load_sql_file_remove_trailing_semicolon(self):
         """Test that trailing semicolon is removed."""
         sql_content = "SELECT * FROM table;"
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False) as f:
-            f.write(sql_content)
-            f.flush()
-
-            result = load_sql_file(pathlib.Path(f.name))
+        result = clean_sql(sql_content)
 
         assert result == 'SELECT * FROM table'
 
+    def test_load_sql_file_reloads_after_edit(self, tmp_path):
+        """Test that cached SQL is invalidated when the file changes."""
+        sql_file = tmp_path / 'query.sql'
+        sql_file.write_text('SELECT 1;')
+        assert load_sql_file(sql_file) == 'SELECT 1'
+
+        sql_file.write_text('SELECT 22;')
+        assert load_sql_file(sql_file) == 'SELECT 22'
+
     def test_load_sql_file_nonexistent(self):
         """Test loading nonexistent SQL file."""
         with pytest.raises(DatabaseOperationError):
@@ -97,6 +105,20 @@ name FROM table"""
         assert 'not_sql' not in result
         assert 'CREATE TABLE table1' in result['table1']
 
+    def test_load_schema_sql_cached_skips_pool(self, tmp_path, monkeypatch):
+        """Test that a fully cached directory is loaded without a thread pool."""
+        import ducklake_core.sql_loader as sql_loader
+
+        (tmp_path / 'table1.sql').write_text('CREATE TABLE table1 (id INTEGER);')
+        (tmp_path / 'table2.sql').write_text('CREATE TABLE table2 (name VARCHAR);')
+        first = load_schema_sql(tmp_path)
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError('thread pool created for cached templates')
+
+        monkeypatch.setattr(sql_loader, 'ThreadPoolExecutor', no_pool)
+        assert load_schema_sql(tmp_path) == first
+
     def test_load_schema_sql_empty_directory(self):
         """Test loading from empty directory."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -138,6 +160,13 @@ name FROM table"""
             # If file doesn't exist, that's also a valid test result
             pass
 
+    def test_load_table_sql_with_params(self):
+        """Test loading materialized-table SQL with parameters."""
+        result = load_table_sql('silver_page_count_enriched', page_columns='p.*', dt_expr='p.dt')
+
+        assert result.startswith('CREATE OR REPLACE TABLE silver_page_count')
+        assert 'SELECT p.*,' in result
+
     def test_load_schema_sql_file(self):
         """Test loading specific schema SQL file."""
         try:
@@ -157,16 +186,12 @@ class TestSQLParameterSubstitution:
         """Test substitution with multiple parameters."""
         sql_content = "SELECT {column} FROM {table} WHERE {condition}"
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False) as f:
-            f.write(sql_content)
-            f.flush()
-
-            result = load_sql_file(
-                pathlib.Path(f.name),
-                column='name',
-                table='users',
-                condition='active = 1'
-            )
+        result = clean_sql(
+            sql_content,
+            column='name',
+            table='users',
+            condition='active = 1'
+        )
 
         assert result == 'SELECT name FROM users WHERE active = 1'
 
@@ -174,11 +199,7 @@ class TestSQLParameterSubstitution:
         """Test substitution with repeated parameters."""
         sql_content = "SELECT {col} FROM table WHERE {col} IS NOT NULL"
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False) as f:
-            f.write(sql_content)
-            f.flush()
-
-            result = load_sql_file(pathlib.Path(f.name), col='timestamp')
+        result = clean_sql(sql_content, col='timestamp')
 
         assert result == 'SELECT timestamp FROM table WHERE timestamp IS NOT NULL'
 
@@ -186,26 +207,26 @@ class TestSQLParameterSubstitution:
         """Test substitution with missing parameter."""
         sql_content = "SELECT {column} FROM {table}"
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False) as f:
-            f.write(sql_content)
-            f.flush()
-
-            # Should raise KeyError when parameter is missing
-            with pytest.raises(DatabaseOperationError):
-                load_sql_file(pathlib.Path(f.name), column='name')  # Missing 'table'
+        # Should raise DatabaseOperationError when parameter is missing
+        with pytest.raises(DatabaseOperationError):
+            clean_sql(sql_content, column='name')  # Missing 'table'
 
     def test_parameter_substitution_no_params_needed(self):
         """Test loading SQL that doesn't need parameters."""
         sql_content = "SELECT * FROM fixed_table"
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False) as f:
-            f.write(sql_content)
-            f.flush()
-
-            result = load_sql_file(pathlib.Path(f.name))
+        result = clean_sql(sql_content)
 
         assert result == 'SELECT * FROM fixed_table'
 
+    def test_parameter_substitution_literal_braces(self):
+        """Test that braces not forming a {name} placeholder are kept verbatim."""
+        sql_content = "SELECT {'a': 1} AS s, json_extract(j, '$.{x-y}') FROM {table}"
+
+        result = clean_sql(sql_content, table='events')
+
+        assert result == "SELECT {'a': 1} AS s, json_extract(j, '$.{x-y}') FROM events"
+
 
 class TestSQLFileCleaning:
     """Test SQL file cleaning functionality."""
@@ -221,11 +242,7 @@ SELECT
 FROM table
 -- Footer comment"""
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False) as f:
-            f.write(sql_content)
-            f.flush()
-
-            result = load_sql_file(pathlib.Path(f.name))
+        result = clean_sql(sql_content)
 
         # Comments should be removed, but structure preserved
         lines = result.split('\n')
@@ -234,6 +251,24 @@ FROM table
         assert 'id,' in result
         assert 'FROM table' in result
 
+    def test_comment_removal_after_block_comment_quote(self):
+        """Test that an apostrophe inside /* */ doesn't hide later -- comments."""
+        result = clean_sql("/* don't */\nSELECT 1 AS x\n-- trailing note")
+
+        assert result == "/* don't */\nSELECT 1 AS x"
+
+    def test_comment_removal_escape_string(self):
+        """Test that E'...' backslash escapes don't end the literal early."""
+        result = clean_sql("SELECT E'it\\'s -- kept' AS a -- dropped\nFROM t")
+
+        assert result == "SELECT E'it\\'s -- kept' AS a\nFROM t"
+
+    def test_comment_removal_dollar_quoted_string(self):
+        """Test that -- inside $$...$$ and $tag$...$tag$ strings is kept."""
+        result = clean_sql("SELECT $$ -- not a comment $$ AS a, $q$ it's $$ -- $q$ AS b -- dropped\nFROM t")
+
+        assert result == "SELECT $$ -- not a comment $$ AS a, $q$ it's $$ -- $q$ AS b\nFROM t"
+
     def test_whitespace_handling(self):
         """Test proper whitespace handling."""
         sql_content = """
@@ -246,11 +281,7 @@ SELECT   *   FROM   table
 
 """
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False) as f:
-            f.write(sql_content)
-            f.flush()
-
-            result = load_sql_file(pathlib.Path(f.name))
+        result = clean_sql(sql_content)
 
         # Should be cleaned up
         assert result == 'SELECT   *   FROM   table'
@@ -264,11 +295,7 @@ FROM table_a a
 JOIN table_b b ON a.id = b.a_id
 WHERE a.active = 1;"""
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False) as f:
-            f.write(sql_content)
-            f.flush()
-
-            result = load_sql_file(pathlib.Path(f.name))
+        result = clean_sql(sql_content)
 
         # Should preserve structure but remove semicolon
         assert 'SELECT' in result
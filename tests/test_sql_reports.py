@@ -15,6 +15,7 @@ import shutil
 from ducklake_core.simple_pipeline import (
     load_sql_reports, 
     create_report_view, 
+    create_report_views,
     run_simple_reports,
     simple_refresh,
     ensure_core_tables,
@@ -23,13 +24,10 @@ from ducklake_core.simple_pipeline import (
 )
 
 
-@pytest.fixture
-def test_db():
-    """Create a temporary test database with sample data."""
-    with tempfile.NamedTemporaryFile(suffix='.duckdb', delete=False) as f:
-        test_db_path = f.name
-    
-    conn = duckdb.connect(test_db_path)
+@pytest.fixture(scope='session')
+def base_db():
+    """Shared in-memory database with core tables and sample data, built once per session."""
+    conn = duckdb.connect(':memory:')
     
     # Set up core tables and sample data
     ensure_core_tables(conn)
@@ -95,7 +93,14 @@ def test_db():
     yield conn
     
     conn.close()
-    pathlib.Path(test_db_path).unlink()
+
+
+@pytest.fixture
+def test_db(base_db):
+    """Run each test in a transaction that is rolled back, leaving the shared data untouched."""
+    base_db.execute('BEGIN')
+    yield base_db
+    base_db.execute('ROLLBACK')
 
 
 class TestSQLReports:
@@ -121,7 +126,29 @@ class TestSQLReports:
             assert report in reports, f"Missing report: {report}"
             assert isinstance(reports[report], str), f"Report {report} should be string"
             assert len(reports[report].strip()) > 0, f"Report {report} should not be empty"
-    
+
+    def test_load_sql_reports_compiled(self, tmp_path, monkeypatch):
+        """Compiled reports are used while the files are unchanged, disk otherwise."""
+        import ducklake_core.simple_pipeline as sp
+
+        sql_file = tmp_path / 'demo.sql'
+        sql_file.write_text("-- header\nSELECT 1 AS x;\n")
+        sources = (('demo.sql', sql_file.stat().st_mtime_ns),)
+        monkeypatch.setattr(sp, 'SQL_REPORTS_DIR', tmp_path)
+        monkeypatch.setattr(sp, '_REPORTS_CACHE', None)
+        monkeypatch.setattr(sp, '_COMPILED_REPORTS', {'demo': 'SELECT 2 AS x'})
+        monkeypatch.setattr(sp, '_COMPILED_SOURCES', sources)
+        assert sp.load_sql_reports() == {'demo': 'SELECT 2 AS x'}
+
+        # A stale compiled module must not shadow the file on disk
+        monkeypatch.setattr(sp, '_REPORTS_CACHE', None)
+        monkeypatch.setattr(sp, '_COMPILED_SOURCES', (('demo.sql', 0),))
+        assert sp.load_sql_reports() == {'demo': 'SELECT 1 AS x'}
+
+        # Without the directory only the compiled reports are available
+        monkeypatch.setattr(sp, 'SQL_REPORTS_DIR', tmp_path / 'missing')
+        assert sp.load_sql_reports() == {'demo': 'SELECT 2 AS x'}
+
     def test_sql_files_exist(self):
         """Test that all expected SQL files exist in sql/reports/."""
         assert SQL_REPORTS_DIR.exists(), "SQL reports directory should exist"
@@ -169,6 +196,16 @@ class TestReportViews:
         result = create_report_view(test_db, 'invalid_report', invalid_sql)
         assert result is False, "View creation should fail with invalid SQL"
     
+    def test_create_report_views_batch(self, test_db):
+        """Test creating several report views in one batch."""
+        result = create_report_views(test_db, {
+            'batch_pages': "SELECT dt, views FROM page_views_daily",
+            'batch_searches': "SELECT dt, cnt FROM searches_daily",
+        })
+
+        assert result == {'v_batch_pages': True, 'v_batch_searches': True}
+        assert test_db.execute("SELECT count(*) FROM v_batch_searches").fetchone()[0] == 5
+    
     def test_all_reports_create_views(self, test_db):
         """Test that all loaded SQL reports can create views."""
         reports = load_sql_reports()
@@ -198,48 +235,87 @@ class TestReportViews:
 class TestReportGeneration:
     """Test full report generation process."""
     
-    def test_run_simple_reports(self, test_db):
+    def test_run_simple_reports(self, test_db, tmp_path):
         """Test running the complete report generation process."""
-        # Create temporary reports directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_reports_dir = pathlib.Path(temp_dir) / 'reports'
-            
-            # Monkey patch REPORTS_DIR for this test
-            import ducklake_core.simple_pipeline as sp
-            original_reports_dir = sp.REPORTS_DIR
-            sp.REPORTS_DIR = temp_reports_dir
-            
-            try:
-                run_simple_reports(test_db)
-                
-                # Check that CSV files were created
-                csv_files = list(temp_reports_dir.glob('*.csv'))
-                assert len(csv_files) > 0, "Should generate CSV reports"
-                
-                # Check summary file was created  
-                summary_file = temp_reports_dir / 'simple_refresh_summary.json'
-                assert summary_file.exists(), "Should create summary JSON"
-                
-                # Verify summary structure
-                import json
-                summary = json.loads(summary_file.read_text())
-                assert 'generated_reports' in summary
-                assert 'created_views' in summary
-                assert 'ts' in summary
-                
-                # Check some CSV files have content
-                non_empty_csvs = 0
-                for csv_file in csv_files:
-                    lines = csv_file.read_text().strip().split('\n')
-                    if len(lines) > 1:  # Header + at least one data row
-                        non_empty_csvs += 1
-                
-                assert non_empty_csvs > 0, "At least some CSV reports should have data"
-                
-            finally:
-                # Restore original REPORTS_DIR
-                sp.REPORTS_DIR = original_reports_dir
-    
+        temp_reports_dir = tmp_path / 'reports'
+
+        run_simple_reports(test_db, reports_dir=temp_reports_dir)
+        
+        # Check that CSV files were created
+        csv_files = list(temp_reports_dir.glob('*.csv'))
+        assert len(csv_files) > 0, "Should generate CSV reports"
+        
+        # Check summary file was created  
+        summary_file = temp_reports_dir / 'simple_refresh_summary.json'
+        assert summary_file.exists(), "Should create summary JSON"
+        
+        # Verify summary structure
+        import json
+        summary = json.loads(summary_file.read_text())
+        assert 'generated_reports' in summary
+        assert 'created_views' in summary
+        assert 'ts' in summary
+        
+        # Check some CSV files have content
+        non_empty_csvs = 0
+        for csv_file in csv_files:
+            lines = csv_file.read_text().strip().split('\n')
+            if len(lines) > 1:  # Header + at least one data row
+                non_empty_csvs += 1
+        
+        assert non_empty_csvs > 0, "At least some CSV reports should have data"
+
+    def test_run_simple_reports_parameterized(self, test_db, tmp_path, monkeypatch):
+        """Test that $name report parameters are bound from params, not interpolated."""
+        import json
+        import ducklake_core.simple_pipeline as sp
+
+        sql_dir = tmp_path / 'sql'
+        sql_dir.mkdir()
+        (sql_dir / 'busy_days.sql').write_text("SELECT dt, views FROM page_views_daily WHERE views > $min_views")
+        (sql_dir / 'all_days.sql').write_text("SELECT dt, 'costs $USD' AS label FROM page_views_daily")
+        (sql_dir / 'quiet_days.sql').write_text("SELECT dt FROM page_views_daily WHERE views < $max_views")
+        monkeypatch.setattr(sp, 'SQL_REPORTS_DIR', sql_dir)
+        monkeypatch.setattr(sp, '_REPORTS_CACHE', None)
+        monkeypatch.setattr(sp, '_COMPILED_REPORTS', None)
+        out_dir = tmp_path / 'reports'
+
+        run_simple_reports(
+            test_db, reports_dir=out_dir, params={'min_views': 1400},
+            report_params={'busy_days': ('min_views',), 'quiet_days': ('max_views',)},
+        )
+
+        summary = json.loads((out_dir / 'simple_refresh_summary.json').read_text())
+        assert summary['generated_reports'] == {'busy_days.csv': 2, 'all_days.csv': 3, 'quiet_days.csv': 0}
+        assert summary['created_views'] == {
+            'v_busy_days': False, 'v_all_days': True, 'v_quiet_days': False,
+        }
+        assert 'costs $USD' in (out_dir / 'all_days.csv').read_text()
+
+    @pytest.mark.parametrize('setup', [
+        ["BEGIN", "CREATE TABLE events (x INTEGER)", "INSERT INTO events VALUES (1), (2)"],
+        ["CREATE TEMP TABLE events AS SELECT * FROM range(2) t(x)"],
+        ["CREATE TABLE events AS SELECT * FROM range(2) t(x)"],
+    ], ids=['open-transaction', 'temp-table', 'autocommit'])
+    def test_run_simple_reports_sees_connection_state(self, setup, tmp_path, monkeypatch):
+        """Test that exports see uncommitted rows and TEMP objects of the caller's connection."""
+        import ducklake_core.simple_pipeline as sp
+
+        sql_dir = tmp_path / 'sql'
+        sql_dir.mkdir()
+        (sql_dir / 'event_count.sql').write_text("SELECT count(*) AS n FROM events")
+        monkeypatch.setattr(sp, 'SQL_REPORTS_DIR', sql_dir)
+        monkeypatch.setattr(sp, '_REPORTS_CACHE', None)
+        monkeypatch.setattr(sp, '_COMPILED_REPORTS', None)
+        conn = duckdb.connect(':memory:')
+        for stmt in setup:
+            conn.execute(stmt)
+
+        run_simple_reports(conn, reports_dir=tmp_path / 'reports')
+
+        assert (tmp_path / 'reports' / 'event_count.csv').read_text().split() == ['n', '2']
+        conn.close()
+
     def test_csv_report_structure(self, test_db):
         """Test that generated CSV reports have proper structure."""
         reports = load_sql_reports()
@@ -260,7 +336,7 @@ class TestReportGeneration:
                     csv_file = temp_reports_dir / f"{report_name}.csv"
                     
                     try:
-                        test_db.execute(f"COPY ({sql}) TO '{csv_file}' (HEADER TRUE, DELIMITER ',')")
+                        test_db.execute(f"COPY ({sql}) TO ? (HEADER TRUE, DELIMITER ',')", [str(csv_file)])
                         
                         # Read and check CSV structure
                         if csv_file.exists():
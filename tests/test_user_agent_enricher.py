@@ -7,6 +7,7 @@ from ducklake_core.user_agent_enricher import (
     parse_with_library,
     add_empty_user_agent_columns,
     create_empty_user_agent_view_sql,
+    create_heuristic_user_agent_view_sql,
     USER_AGENT_COLUMNS
 )
 
@@ -61,7 +62,7 @@ class TestUserAgentEnrichment:
 
         # Check that boolean columns are integers (0 or 1)
         for col in ['is_mobile', 'is_tablet', 'is_pc', 'is_bot']:
-            assert result[col].dtype == 'int64'
+            assert result[col].dtype.kind == 'i'
             assert result[col].isin([0, 1]).all()
 
     def test_heuristic_parsing_windows_chrome(self):
@@ -101,6 +102,24 @@ class TestUserAgentEnrichment:
         assert result['browser'].iloc[0] == 'unknown'
         assert result['device'].iloc[0] == 'unknown'
 
+    def test_heuristic_parsing_matches_without_hyperscan(self, monkeypatch):
+        """Test the hyperscan and pandas heuristic backends agree."""
+        import ducklake_core.user_agent_enricher as uae
+        if uae.hyperscan is None:
+            pytest.skip('hyperscan not installed')
+        uas = [
+            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/91.0 Safari/537.36',
+            'Mozilla/5.0 (Linux; Android 10) Mobile Safari/537.36',
+            'Googlebot/2.1 (+http://www.google.com/bot.html)',
+            '',
+            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/91.0 Safari/537.36',
+        ]
+        fast = parse_with_heuristics(pd.DataFrame({'user_agent': uas}))
+        monkeypatch.setattr(uae, 'hyperscan', None)
+        slow = parse_with_heuristics(pd.DataFrame({'user_agent': uas}))
+
+        pd.testing.assert_frame_equal(fast, slow)
+
     def test_add_empty_user_agent_columns(self):
         """Test adding empty user agent columns to dataframe."""
         df = pd.DataFrame({'existing_col': [1, 2, 3]})
@@ -127,6 +146,28 @@ class TestUserAgentEnrichment:
         for col in USER_AGENT_COLUMNS:
             assert col in sql
 
+    def test_heuristic_view_sql_matches_pandas_heuristics(self):
+        """Test the DuckDB heuristic view agrees with parse_with_heuristics."""
+        import duckdb
+        uas = [
+            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/91.0 Safari/537.36',
+            'Mozilla/5.0 (Linux; Android 10) Safari/537.36',
+            'Mozilla/5.0 (X11; Linux x86_64) Firefox/89.0',
+            'Googlebot/2.1 (+http://www.google.com/bot.html)',
+            'Mozilla/5.0 (iPhone; CPU iPhone OS 14_6 like Mac OS X) mobile Safari/604.1',
+            '',
+        ]
+        conn = duckdb.connect()
+        conn.execute("CREATE TABLE lake_page_count AS SELECT unnest(?) AS user_agent", [uas])
+        conn.execute(create_heuristic_user_agent_view_sql())
+
+        sql_rows = conn.execute(
+            f"SELECT {', '.join(USER_AGENT_COLUMNS)} FROM silver_page_count"
+        ).fetchall()
+        expected = parse_with_heuristics(pd.DataFrame({'user_agent': uas}))[USER_AGENT_COLUMNS]
+
+        assert sql_rows == [tuple(r) for r in expected.itertuples(index=False)]
+
 
 class TestUserAgentParsingFallback:
     """Test user agent parsing with and without the user_agents library."""